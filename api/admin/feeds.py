@@ -9,8 +9,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from lib.supabase import (
     get_all_feeds, get_feed_by_id, create_feed,
-    update_feed, delete_feed, toggle_feed_active
+    update_feed, delete_feed, toggle_feed_active, get_feed_health_rows
 )
+from lib.circuit_breaker import feed_health
+from lib.http_client import http_get
 
 
 def verify_admin_token(headers):
@@ -62,6 +64,16 @@ class handler(BaseHTTPRequestHandler):
                 feeds = get_all_feeds()
                 self.send_json({'feeds': feeds, 'count': len(feeds)})
 
+            # GET /api/admin/feeds/health - Circuit breaker / fetch health per feed
+            elif len(path_parts) == 4 and path_parts[3] == 'health':
+                feeds = [
+                    {'id': f['id'], 'name': f['name'], 'url': f['url'],
+                     'is_active': f['is_active'], **feed_health(f)}
+                    for f in get_feed_health_rows()
+                ]
+                open_count = sum(1 for f in feeds if f['circuit'] != 'closed')
+                self.send_json({'feeds': feeds, 'count': len(feeds), 'open_circuits': open_count})
+
             # GET /api/admin/feeds/:id - Get single feed
             elif len(path_parts) == 4:
                 feed_id = path_parts[3]
@@ -120,7 +132,16 @@ class handler(BaseHTTPRequestHandler):
                     self.send_error_json('URL is required', 400)
                     return
 
-                feed = feedparser.parse(url)
+                # An unreachable URL is a failed validation, not a server error
+                # (either HTTP backend may raise here, so catch broadly)
+                try:
+                    resp = http_get(url, timeout=10)
+                    resp.raise_for_status()
+                except Exception as e:
+                    self.send_json({'valid': False, 'error': f'Could not fetch feed: {str(e)[:200]}'})
+                    return
+
+                feed = feedparser.parse(resp.content)
                 if feed.bozo and not feed.entries:
                     self.send_json({
                         'valid': False,
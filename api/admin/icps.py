@@ -12,6 +12,7 @@ from lib.supabase import (
     get_all_icp_profiles, get_icp_profile_by_id, create_icp_profile,
     update_icp_profile, delete_icp_profile, set_default_icp_profile
 )
+from lib.icp_signals import build_signal_index
 
 
 def verify_admin_token(headers):
@@ -217,6 +218,8 @@ class handler(BaseHTTPRequestHandler):
                     'name': name,
                     'description': data.get('description', ''),
                     'data': icp_data,
+                    # Pain signals for enrichment, derived once here rather than per digest
+                    'signal_index': build_signal_index(icp_data),
                     'source_type': source_type,
                     'is_active': data.get('is_active', True),
                     'is_default': data.get('is_default', False),
@@ -276,6 +279,8 @@ class handler(BaseHTTPRequestHandler):
                 if not update_data:
                     self.send_error_json('No fields to update', 400)
                     return
+                if 'data' in update_data:
+                    update_data['signal_index'] = build_signal_index(update_data['data'])
 
                 profile = update_icp_profile(profile_id, update_data)
                 if profile:
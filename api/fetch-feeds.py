@@ -0,0 +1,137 @@
+"""POST /api/fetch-feeds - Fetch many RSS feeds concurrently in one call.
+
+Request body: { "names": ["TechCrunch AI", "Wired AI", ...], "days": 7, "stream": false }
+("days" is clamped to 1-30; anything that isn't a number means 7)
+Response: {
+    "success": true,
+    "articles": [...],          # merged, deduplicated by link and story, newest first
+    "errors": [{ "source": "...", "error": "..." }],
+    "sources_checked": 2
+}
+
+Streaming mode ("stream": true) answers with newline-delimited JSON
+(application/x-ndjson), one line per feed as soon as that feed is fetched
+and enriched, then a final summary line:
+    { "type": "feed", "source": "...", "success": true, "articles": [...], "error": null }
+    { "type": "done", "sources_checked": 2, "errors": [...] }
+Articles already sent for an earlier feed are left out of later lines. An
+article that is a near duplicate of a story already sent (the same news from
+another outlet, see api/lib/dedupe.py) isn't sent as an article either; it
+follows its feed line as a coverage line for that story:
+    { "type": "coverage", "link": "<story link>", "coverage": [{ "source", "title", "link", "published" }] }
+
+Replaces the one-invocation-per-feed fan-out from the digest page: feeds are
+fetched on a thread pool inside a single function invocation. With
+USE_INGESTED_ARTICLES=true (database mode) articles are instead read from the
+`articles` table the ingestion cron keeps filled — one query, no live fetches.
+"""
+
+import json
+import os
+from http.server import BaseHTTPRequestHandler
+from api.lib.feed_fetcher import (
+    fetch_feeds, iter_feed_results, merge_feed_results, dedupe_new_articles, clamp_days
+)
+from api.lib.article_store import iter_stored_feed_results
+from api.lib.dedupe import StoryClusterer, coverage_entry
+
+USE_INGESTED_ARTICLES = (
+    os.environ.get('USE_DATABASE', 'false').lower() == 'true'
+    and os.environ.get('USE_INGESTED_ARTICLES', 'false').lower() == 'true'
+)
+
+MAX_FEEDS_PER_REQUEST = 200
+
+
+class handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        content_length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(content_length)) if content_length else {}
+
+        names = body.get('names', [])
+        days = clamp_days(body.get('days'))
+        stream = bool(body.get('stream', False))
+
+        if not isinstance(names, list) or not names:
+            self.send_json_headers()
+            self.wfile.write(json.dumps({
+                'success': False, 'articles': [], 'errors': [], 'sources_checked': 0,
+                'error': 'names must be a non-empty list of feed names'
+            }).encode())
+            return
+
+        names = names[:MAX_FEEDS_PER_REQUEST]
+        if stream:
+            self.stream_feeds(names, days)
+            return
+
+        self.send_json_headers()
+        if USE_INGESTED_ARTICLES:
+            result = merge_feed_results(iter_stored_feed_results(names, days))
+        else:
+            result = fetch_feeds(names, days)
+        self.wfile.write(json.dumps({
+            'success': True,
+            'articles': result['articles'],
+            'errors': result['errors'],
+            'sources_checked': result['sources_checked'],
+            'error': None,
+        }).encode())
+
+    def stream_feeds(self, names, days):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('X-Accel-Buffering', 'no')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+
+        seen_links = set()
+        stories = StoryClusterer()
+        errors = []
+        checked = 0
+        results = (iter_stored_feed_results(names, days) if USE_INGESTED_ARTICLES
+                   else iter_feed_results(names, days))
+        try:
+            for result in results:
+                checked += 1
+                if not result['success']:
+                    errors.append({'source': result['source'], 'error': result['error']})
+                articles, line_links, coverage = [], set(), {}
+                for article in dedupe_new_articles(result['articles'], seen_links):
+                    story = stories.add(article)
+                    if story is None:
+                        articles.append(article)
+                        line_links.add(article['link'])
+                    elif story['link'] not in line_links:
+                        # Stories in this line already carry their coverage
+                        coverage.setdefault(story['link'], []).append(coverage_entry(article))
+                self.write_line({
+                    'type': 'feed',
+                    'source': result['source'],
+                    'success': result['success'],
+                    'articles': articles,
+                    'error': result['error'],
+                })
+                for link, entries in coverage.items():
+                    self.write_line({'type': 'coverage', 'link': link, 'coverage': entries})
+            self.write_line({'type': 'done', 'sources_checked': checked, 'errors': errors})
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Client went away mid-stream; nothing left to send to.
+
+    def write_line(self, obj):
+        self.wfile.write(json.dumps(obj).encode() + b'\n')
+        self.wfile.flush()
+
+    def send_json_headers(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+
+    def do_OPTIONS(self):
+        self.send_response(200)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Access-Control-Allow-Methods', 'POST, OPTIONS')
+        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+        self.end_headers()
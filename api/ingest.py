@@ -0,0 +1,44 @@
+"""GET /api/ingest - Cron handler for background feed ingestion.
+
+Invoked by the Vercel cron schedule in vercel.json. Fetches and enriches
+every active feed and upserts the articles into the `articles` table, then
+pre-generates TL;DRs for the top new stories (api/lib/prewarm.py) with
+whatever time is left of the function's maxDuration.
+
+Response: { "success": true, "summary": { feeds_checked, articles_new, articles_stored, errors, prewarm, ... } }
+"""
+
+import json
+import os
+from http.server import BaseHTTPRequestHandler
+from api.lib.ingest import run_ingestion
+
+# maxDuration of this function in vercel.json, less time to send the response
+TIME_LIMIT_SECONDS = 60 - 5
+
+
+def verify_cron_secret(headers):
+    """Vercel cron sends `Authorization: Bearer $CRON_SECRET`."""
+    cron_secret = os.environ.get('CRON_SECRET', '')
+    if not cron_secret:
+        return True  # Dev mode
+    return headers.get('Authorization', '') == f'Bearer {cron_secret}'
+
+
+class handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if not verify_cron_secret(self.headers):
+            self.send_json({'success': False, 'error': 'Unauthorized'}, 401)
+            return
+
+        try:
+            summary = run_ingestion(time_limit=TIME_LIMIT_SECONDS)
+            self.send_json({'success': True, 'summary': summary, 'error': None})
+        except Exception as e:
+            self.send_json({'success': False, 'summary': None, 'error': str(e)}, 500)
+
+    def send_json(self, data, status=200):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps(data).encode())
@@ -0,0 +1,138 @@
+"""Batch enrichment over a whole ingestion window.
+
+enrich_articles() scores one article at a time. For a full ingestion run
+(thousands of articles across every feed) this builds one sparse
+article x keyword matrix from the matcher's hit sets and scores every
+article with a handful of matrix ops: one product against a keyword x group
+matrix gives, per article, the hit count for the AI, SMB and viral lists,
+each topic rule and each ICP pain signal (default and per-profile).
+
+Output is identical to enrich_articles() (scripts/bench_ingest.py --batch
+and scripts/check_batch_enrich.py check this). Needs numpy and scipy; without them, or for small batches,
+it just calls enrich_articles().
+"""
+
+from functools import lru_cache
+from api.shared import (
+    TOPIC_KEYWORDS, IMPACT_TEMPLATES, KEYWORD_SETTINGS,
+    enrich_articles, enrichment_matcher, article_keyword_hits, get_icp_pain_signals,
+    get_icp_profile_signals, all_icp_signals, extract_key_bullets, generate_viral_suggestions,
+    refresh_keyword_lists, keyword_lists,
+)
+
+try:
+    import numpy as np
+    from scipy import sparse
+except ImportError:
+    np = None
+    sparse = None
+
+# Below this many articles the matrix setup costs more than it saves
+MIN_BATCH = 200
+
+
+def enrich_batch(articles, pain_signals=None, icp_profiles=None, min_batch=MIN_BATCH):
+    """Same result as enrich_articles(articles), computed for the batch at once.
+
+    Batches smaller than `min_batch` go through enrich_articles().
+    """
+    if np is None or len(articles) < min_batch:
+        return enrich_articles(articles, pain_signals, icp_profiles)
+
+    refresh_keyword_lists()
+    if pain_signals is None:
+        pain_signals = get_icp_pain_signals()
+    if icp_profiles is None:
+        icp_profiles = get_icp_profile_signals()
+    signal_sets = [pain_signals] + [signals for _, signals in icp_profiles]
+    # One KeywordLists for the whole batch, so the matcher and the group
+    # matrix come from the same lists even if they're swapped mid-batch
+    lists = keyword_lists()
+    matcher = enrichment_matcher(all_icp_signals(pain_signals, icp_profiles), lists)
+    vocab, groups = _group_matrix(matcher, lists, _signal_key(signal_sets))
+
+    # Article x keyword incidence matrix
+    all_hits = [article_keyword_hits(a, matcher) for a in articles]
+    rows, cols = [], []
+    for i, hits in enumerate(all_hits):
+        for keyword in hits:
+            rows.append(i)
+            cols.append(vocab[keyword])
+    incidence = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(len(articles), len(vocab)),
+    )
+
+    # Article x group hit counts. Column layout: AI, SMB, viral, topics...,
+    # then one block of signals per signal set (default first, then profiles)
+    counts = (incidence @ groups).toarray()
+    relevant = counts[:, 0] > 0
+    smb_scores = np.minimum(counts[:, 1] * 2, 10)
+    viral_scores = np.minimum(counts[:, 2] * 2, 10)
+
+    # First topic rule with a hit (argmax returns the first True), else General
+    start = 3 + len(TOPIC_KEYWORDS)
+    first_topic = _first_hit(counts[:, 3:start])
+
+    # First matching signal in each signal set
+    first_signals = []
+    for signals in signal_sets:
+        first_signals.append(_first_hit(counts[:, start:start + len(signals)]))
+        start += len(signals)
+
+    enriched = []
+    for i in np.flatnonzero(relevant):
+        article = articles[i]
+        topic = TOPIC_KEYWORDS[first_topic[i]][0] if first_topic[i] >= 0 else 'General AI News'
+        templates = IMPACT_TEMPLATES.get(topic, IMPACT_TEMPLATES['General AI News'])
+        smb_impacts = [signals[first[i]]['smb_impact'] if first[i] >= 0 else templates['smb']
+                       for signals, first in zip(signal_sets, first_signals)]
+
+        article['smb_score'] = int(smb_scores[i])
+        article['topic'] = topic
+        article['key_bullets'] = extract_key_bullets(article)
+        article['viral_score'] = int(viral_scores[i])
+        article['impact'] = {'general_impact': templates['general'], 'smb_impact': smb_impacts[0]}
+        article['icp_impacts'] = {name: impact for (name, _), impact in zip(icp_profiles, smb_impacts[1:])}
+        article['content_suggestions'] = generate_viral_suggestions(article, all_hits[i])
+        enriched.append(article)
+    return enriched
+
+
+def _first_hit(block):
+    """Per row, the index of the first column with a hit, or -1."""
+    if block.shape[1] == 0:
+        return np.full(block.shape[0], -1)
+    hit = block > 0
+    return np.where(hit.any(axis=1), hit.argmax(axis=1), -1)
+
+
+def _signal_key(signal_sets):
+    return tuple(tuple(signal['keywords']) for signals in signal_sets for signal in signals)
+
+
+@lru_cache(maxsize=8)
+def _group_matrix(matcher, lists, signal_keywords):
+    """Keyword index and the keyword x group weight matrix for a matcher built
+    from `lists` (a KeywordLists).
+
+    A keyword's weight in a group is how many times the group's list names
+    it, matching the `sum(1 for kw in LIST if kw in hits)` scorers. Keywords
+    the matcher can't produce (e.g. not lowercase) never count, as before.
+    """
+    vocab = {keyword: i for i, keyword in enumerate(sorted(matcher.keywords))}
+    group_lists = [lists.lists[key] for key in KEYWORD_SETTINGS]
+    group_lists += [keywords for _, keywords in TOPIC_KEYWORDS]
+    group_lists += list(signal_keywords)
+
+    rows, cols = [], []
+    for col, keywords in enumerate(group_lists):
+        for keyword in keywords:
+            if keyword in vocab:
+                rows.append(vocab[keyword])
+                cols.append(col)
+    groups = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+        shape=(len(vocab), len(group_lists)),
+    )
+    return vocab, groups
@@ -0,0 +1,52 @@
+"""Per-feed circuit breaker.
+
+A feed that fails FAILURE_THRESHOLD times in a row (timeouts, HTTP errors,
+bodies that aren't a feed) has its circuit opened: fetches skip it without
+touching the network until a cooldown passes. The cooldown starts at
+BASE_COOLDOWN_SECONDS and doubles with each further failure, up to
+MAX_COOLDOWN_SECONDS. Once it passes the circuit is half-open: the next fetch
+is a trial, and its outcome closes the circuit or re-opens it for longer.
+
+Works off the fetch state the fetcher already records (consecutive_failures,
+last_fetched_at, fetch_error — see api/lib/feed_state.py), so no extra storage.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+FAILURE_THRESHOLD = 3
+BASE_COOLDOWN_SECONDS = 30 * 60
+MAX_COOLDOWN_SECONDS = 24 * 60 * 60
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+def cooldown_seconds(failures):
+    """Cooldown after `failures` consecutive failures (only meaningful past the threshold)."""
+    extra = max(failures - FAILURE_THRESHOLD, 0)
+    return min(BASE_COOLDOWN_SECONDS * (2 ** min(extra, 10)), MAX_COOLDOWN_SECONDS)
+
+
+def circuit_status(state, now=None):
+    """Return CLOSED, OPEN or HALF_OPEN for a feed's stored fetch state."""
+    failures = state.get('consecutive_failures') or 0
+    if failures < FAILURE_THRESHOLD:
+        return CLOSED
+    last_attempt = state.get('last_fetched_at')
+    if not last_attempt:
+        return HALF_OPEN
+    now = now or datetime.now(timezone.utc)
+    reopen_at = datetime.fromisoformat(last_attempt) + timedelta(seconds=cooldown_seconds(failures))
+    return OPEN if now < reopen_at else HALF_OPEN
+
+
+def feed_health(state, now=None):
+    """Summarize a feed's fetch state for the admin health view."""
+    return {
+        'circuit': circuit_status(state, now),
+        'consecutive_failures': state.get('consecutive_failures') or 0,
+        'fetch_error': state.get('fetch_error'),
+        'last_fetched_at': state.get('last_fetched_at'),
+        'next_poll_at': state.get('next_poll_at'),
+    }
@@ -0,0 +1,86 @@
+"""Entry date parsing for feeds that don't come with parsed dates.
+
+dateutil.parser.parse handles almost anything but is slow, and a feed uses
+the same date format for every entry. parse_date() tries the fast parsers
+(RFC 822 via email.utils, ISO 8601 via datetime.fromisoformat) and only then
+dateutil, and remembers per source which one worked, so the rest of that
+feed's entries go straight to it.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_tz
+from dateutil import parser as date_parser
+
+
+def _parse_rfc822(value):
+    parts = parsedate_tz(value)
+    if parts is None:
+        return None
+    # No zone means UTC (mktime_tz() would read it as local time)
+    offset = timezone(timedelta(seconds=parts[9] or 0))
+    return datetime(*parts[:6], tzinfo=offset)
+
+
+def _parse_iso8601(value):
+    if value.endswith(('Z', 'z')):
+        value = value[:-1] + '+00:00'  # fromisoformat() only takes 'Z' on 3.11+
+    return datetime.fromisoformat(value)
+
+
+def _parse_any(value):
+    return date_parser.parse(value)
+
+
+# Tried in order; dateutil last
+PARSERS = (
+    ('rfc822', _parse_rfc822),
+    ('iso8601', _parse_iso8601),
+    ('dateutil', _parse_any),
+)
+_PARSER_FUNCS = dict(PARSERS)
+
+# source name -> name of the parser that last worked for it
+_source_formats = {}
+
+
+def parse_date(value, source=None):
+    """Parse a date string to a UTC-aware datetime, or None if nothing can.
+
+    `source` (the feed name) keys the memoized format: its parser is tried
+    first, and whichever parser succeeds becomes the new one.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    known = _source_formats.get(source)
+    if known:
+        parsed = _try(_PARSER_FUNCS[known], value)
+        if parsed:
+            return parsed
+    for name, parse in PARSERS:
+        if name == known:
+            continue
+        parsed = _try(parse, value)
+        if parsed:
+            if source is not None:
+                _source_formats[source] = name
+            return parsed
+    return None
+
+
+def source_format(source):
+    """Name of the parser memoized for a source, or None."""
+    return _source_formats.get(source)
+
+
+def _try(parse, value):
+    try:
+        parsed = parse(value)
+    except (ValueError, OverflowError, TypeError):
+        return None
+    if parsed is None:
+        return None
+    # Normalize to UTC-aware
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
@@ -0,0 +1,151 @@
+"""Near-duplicate story clustering across feeds.
+
+Link dedupe only catches the same URL. The same announcement covered by
+TechCrunch, The Verge and a handful of newsletters arrives as several
+articles with different links and lightly reworded text. Each article gets a
+MinHash signature over word shingles of its title + summary; LSH banding puts
+signatures that agree on any band in the same bucket, so an article is only
+compared with the few stories it shares a bucket with rather than with every
+story so far. Candidates whose estimated Jaccard similarity reaches
+SIMILARITY_THRESHOLD join that story.
+
+Only other outlets' versions count as duplicates. Articles from the same
+source join a story only when their titles are the same word for word:
+recurring posts (newsletter issues, weekly roundups) share boilerplate
+summaries and would otherwise be folded into their previous issue.
+
+Each story keeps one canonical article with a `coverage` list of the other
+outlets' versions ({source, title, link, published}); the length of that list
+is a cross-source "trending" signal.
+
+numpy speeds up signature computation when installed; results are the same
+without it.
+"""
+
+import random
+import zlib
+from api.lib.keyword_matcher import tokenize
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+SHINGLE_WORDS = 2
+NUM_PERM = 64
+BANDS = 16              # 16 bands x 4 rows: candidates from ~0.5 similarity up
+ROWS = NUM_PERM // BANDS
+SIMILARITY_THRESHOLD = 0.5
+
+# Universal hash family h(x) = (a*x + b) mod p, fixed seed so signatures are
+# stable across processes. p < 2**31 keeps a*x inside uint64 for numpy.
+_PRIME = (1 << 31) - 1
+_rng = random.Random(1729)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+if np is not None:
+    _A = np.array([a for a, _ in _PERMS], dtype=np.uint64)
+    _B = np.array([b for _, b in _PERMS], dtype=np.uint64)
+
+
+def shingles(text):
+    """Hashed SHINGLE_WORDS-word shingles of text (single words for very short text)."""
+    tokens = tokenize(text)
+    if len(tokens) < SHINGLE_WORDS:
+        grams = tokens
+    else:
+        grams = map(' '.join, zip(*(tokens[i:] for i in range(SHINGLE_WORDS))))
+    return {zlib.crc32(gram.encode()) % _PRIME for gram in grams}
+
+
+def signature(text):
+    """MinHash signature (tuple of NUM_PERM ints) of text, or None if it has no words."""
+    hashes = shingles(text)
+    if not hashes:
+        return None
+    if np is not None:
+        values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+        return tuple(((values[:, None] * _A + _B) % _PRIME).min(axis=0).tolist())
+    return tuple(min((a * x + b) % _PRIME for x in hashes) for a, b in _PERMS)
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def story_text(article):
+    return f"{article.get('title', '')} {article.get('summary', '')}"
+
+
+def coverage_entry(article):
+    """What a story's coverage list keeps of a duplicate article."""
+    return {
+        'source': article.get('source'),
+        'title': article.get('title'),
+        'link': article.get('link'),
+        'published': article.get('published'),
+    }
+
+
+class StoryClusterer:
+    """Incremental story clustering. The first article of a story is its canonical one."""
+
+    def __init__(self, threshold=SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self.stories = []       # canonical articles, in the order they were added
+        self._signatures = []   # parallel to stories
+        self._buckets = {}      # (band, band values) -> [story index]
+
+    def add(self, article):
+        """Add an article. Returns the canonical article it was folded into
+        (its `coverage` now lists this one), or None if it starts a new story."""
+        article.setdefault('coverage', [])
+        sig = signature(story_text(article))
+        if sig is None:
+            self.stories.append(article)
+            self._signatures.append(None)
+            return None
+
+        keys = [(band, sig[band * ROWS:(band + 1) * ROWS]) for band in range(BANDS)]
+        # Most similar candidate; ties go to the earlier story
+        best, best_score = None, 0.0
+        candidates = {i for key in keys for i in self._buckets.get(key, ())}
+        for i in sorted(candidates):
+            if not self._may_join(article, self.stories[i]):
+                continue
+            score = similarity(sig, self._signatures[i])
+            if score >= self.threshold and score > best_score:
+                best, best_score = i, score
+        if best is not None:
+            story = self.stories[best]
+            story['coverage'].append(coverage_entry(article))
+            return story
+
+        index = len(self.stories)
+        self.stories.append(article)
+        self._signatures.append(sig)
+        for key in keys:
+            self._buckets.setdefault(key, []).append(index)
+        return None
+
+    @staticmethod
+    def _may_join(article, story):
+        """Whether article can be another version of story: it comes from a
+        source the story doesn't have yet, or repeats the canonical title."""
+        source = article.get('source')
+        if source != story.get('source') and all(c['source'] != source for c in story['coverage']):
+            return True
+        return tokenize(article.get('title', '')) == tokenize(story.get('title', ''))
+
+
+def cluster_articles(articles):
+    """Fold near-duplicate articles into stories; returns the canonical articles.
+
+    The canonical article of a story is the one from the highest-priority
+    source, then the earliest published (usually the original report).
+    Order of the result follows that preference; callers re-sort as needed.
+    """
+    clusterer = StoryClusterer()
+    for article in sorted(articles, key=lambda a: (a.get('priority', 99), a.get('published', ''))):
+        clusterer.add(article)
+    return clusterer.stories
@@ -0,0 +1,257 @@
+"""Feed fetching for the digest endpoints.
+
+Wraps the fetch -> parse -> date filter -> enrich pipeline for a single feed
+so it can run once per request (/api/fetch-feed) or fanned out across a
+thread pool from one invocation (/api/fetch-feeds), either collected into one
+response or streamed back feed by feed as each one finishes.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+import feedparser
+import requests
+from api.shared import RSS_FEEDS, parse_feed_entries, enrich_articles, normalize_link
+from api.lib.http_client import http_get
+from api.lib import stream_feed_parser
+from api.lib.feed_state import get_feed_state, save_feed_state
+from api.lib.poll_schedule import schedule_next_poll
+from api.lib.circuit_breaker import circuit_status, OPEN, HALF_OPEN
+from api.lib.dedupe import cluster_articles
+
+FETCH_TIMEOUT = 8  # seconds, per feed
+
+# 'stream' (incremental parser, feedparser fallback) or 'feedparser'
+FEED_PARSER = os.environ.get('FEED_PARSER', 'stream').lower()
+
+# Entries older than this are never parsed or cached; digest windows are clamped to it.
+MAX_WINDOW_DAYS = 30
+
+DEFAULT_DAYS = 7
+
+# Feed fetches are network-bound, so threads overlap nearly all of the wait.
+# The pool is big enough to fetch all of RSS_FEEDS (52) in one wave: in waves
+# of FETCH_TIMEOUT each they would outlast /api/fetch-feeds' 30s maxDuration
+# (vercel.json). Larger requests queue rather than start a thread per feed.
+# Per-host concurrency is bounded separately by the HTTP client (MAX_PER_HOST).
+MAX_WORKERS = 64
+
+
+def clamp_days(value, default=DEFAULT_DAYS):
+    """A request's `days` as an int in 1..MAX_WINDOW_DAYS; default if it isn't a number."""
+    try:
+        days = int(value)
+    except (TypeError, ValueError):
+        return default
+    return min(max(days, 1), MAX_WINDOW_DAYS)
+
+
+def fetch_feed(name, days=7, config=None, seen=None, enrich=True):
+    """Fetch one feed and return its enriched articles.
+
+    `config` ({url, category, priority}) defaults to the RSS_FEEDS entry for
+    `name`; the ingestion worker passes rows from the feeds table instead.
+    Entries whose normalized link is in `seen` (already ingested) are dropped
+    before enrichment. With enrich=False the date-filtered entries are
+    returned unenriched, for callers that enrich a whole batch at once.
+
+    Never raises — failures are reported in the result so one bad publisher
+    can't take down a batch.
+
+    Returns { 'source': name, 'success': bool, 'articles': [...], 'error': str|None }.
+    """
+    if config is None:
+        if name not in RSS_FEEDS:
+            return _result(name, error=f'Unknown feed: {name}')
+        config = RSS_FEEDS[name]
+    cutoff = datetime.now(timezone.utc) - timedelta(days=min(days, MAX_WINDOW_DAYS))
+    url = config['url']
+    state = get_feed_state(url)
+
+    # Dead or broken feeds are skipped without a network call until their
+    # cooldown passes (see api/lib/circuit_breaker.py).
+    circuit = circuit_status(state)
+    if circuit == OPEN:
+        return _result(name, error=f"Circuit open: {state.get('fetch_error') or 'repeated failures'}")
+    if circuit == HALF_OPEN:
+        # Claim the trial fetch so concurrent callers keep seeing an open circuit
+        save_feed_state(url, last_fetched_at=datetime.now(timezone.utc).isoformat())
+
+    try:
+        articles = _fetch_entries(name, config, state)
+        if articles is None:
+            _record_failure(url, state, 'Feed parsing error')
+            return _result(name, error='Feed parsing error')
+
+        # Filter by date. The parse/cache window is wider than any one request,
+        # and `seen` is applied here rather than at parse time for the same
+        # reason: the cached entries must stay valid for every caller.
+        articles = [a for a in articles
+                    if datetime.fromisoformat(a['published']) > cutoff]
+        if seen:
+            articles = [a for a in articles if normalize_link(a['link']) not in seen]
+        # Enrich with AI relevance, SMB scores, topics
+        if enrich:
+            articles = enrich_articles(articles)
+        return _result(name, articles=articles)
+
+    except requests.exceptions.Timeout:
+        _record_failure(url, state, 'Timeout')
+        return _result(name, error='Timeout')
+    except Exception as e:
+        _record_failure(url, state, str(e)[:100])
+        return _result(name, error=str(e)[:100])
+
+
+def _fetch_entries(name, config, state):
+    """Download and parse a feed, using a conditional GET when we hold a cached copy.
+
+    A 304 answer reuses the entries parsed from the cached body, skipping both
+    the download and the parse. Successful polls also reschedule the feed (see
+    api/lib/poll_schedule.py). Returns parse_feed_entries() output (fresh dicts
+    the caller may mutate), or None if the body isn't a usable feed.
+    """
+    url = config['url']
+    cached = state.get('cached_entries')
+
+    headers = {}
+    if cached is not None:
+        if state.get('etag'):
+            headers['If-None-Match'] = state['etag']
+        if state.get('last_modified'):
+            headers['If-Modified-Since'] = state['last_modified']
+
+    resp = http_get(url, headers=headers, timeout=FETCH_TIMEOUT)
+    now = datetime.now(timezone.utc).isoformat()
+
+    if resp.status_code == 304 and cached is not None:
+        save_feed_state(url, last_fetched_at=now, fetch_error=None,
+                        **schedule_next_poll(state, 'not_modified'))
+        return [dict(a) for a in cached]
+    resp.raise_for_status()
+
+    feed = parse_feed_body(resp.content, source=name)
+    # Malformed XML, or a page that isn't RSS/Atom at all (e.g. an HTML blog index)
+    if not feed.entries and (feed.bozo or not feed.version):
+        return None
+
+    window_start = datetime.now(timezone.utc) - timedelta(days=MAX_WINDOW_DAYS)
+    articles = parse_feed_entries(feed, name, config, cutoff=window_start)
+    if resp.status_code == 200:
+        fields = dict(last_fetched_at=now, fetch_error=None,
+                      **schedule_next_poll(state, 'fetched', articles))
+        # The cached entries are only ever reused on a 304, so they are
+        # written (in database mode, a 30-day JSONB blob on the feeds row) only
+        # when the validators they answer to change, and dropped when the
+        # feed stops sending validators.
+        etag, last_modified = resp.headers.get('ETag'), resp.headers.get('Last-Modified')
+        if etag or last_modified:
+            if cached is None or (etag, last_modified) != (state.get('etag'), state.get('last_modified')):
+                fields.update(etag=etag, last_modified=last_modified,
+                              cached_entries=[dict(a) for a in articles])
+        elif cached is not None:
+            fields.update(etag=None, last_modified=None, cached_entries=None)
+        save_feed_state(url, **fields)
+    return articles
+
+
+def parse_feed_body(content, source=None):
+    """Parse a feed body with the configured backend.
+
+    The incremental parser only reads the fields we use; feedparser remains
+    the fallback for anything it can't handle (malformed XML, undeclared
+    HTML entities, unknown formats) and for empty results.
+    """
+    if FEED_PARSER == 'stream':
+        feed = stream_feed_parser.parse(content, source)
+        if feed is not None and feed.entries:
+            return feed
+    return feedparser.parse(content)
+
+
+def _record_failure(url, state, error):
+    """Record a failed fetch: bumps consecutive_failures (which drives both the
+    poll backoff and the circuit breaker) and stamps the attempt time."""
+    save_feed_state(
+        url,
+        fetch_error=error,
+        last_fetched_at=datetime.now(timezone.utc).isoformat(),
+        **schedule_next_poll(state, 'failed'),
+    )
+
+
+def fetch_feeds(names, days=7):
+    """Fetch several feeds concurrently and merge their articles.
+
+    Returns merge_feed_results() output for the fetched feeds.
+    """
+    names = list(dict.fromkeys(names))  # drop repeated names, keep order
+    if not names:
+        return merge_feed_results([])
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(names))) as pool:
+        results = list(pool.map(lambda n: fetch_feed(n, days), names))
+    return merge_feed_results(results)
+
+
+def merge_feed_results(results):
+    """Merge per-feed results into one article set.
+
+    Articles are deduplicated by normalized link (first result wins), near
+    duplicates from different outlets are folded into one article with a
+    `coverage` list (api/lib/dedupe.py), and the result is sorted newest first.
+
+    Returns { 'articles': [...], 'errors': [{ 'source', 'error' }], 'sources_checked': int }.
+    """
+    articles = []
+    errors = []
+    seen_links = set()
+    checked = 0
+    for result in results:
+        checked += 1
+        if not result['success']:
+            errors.append({'source': result['source'], 'error': result['error']})
+            continue
+        articles.extend(dedupe_new_articles(result['articles'], seen_links))
+
+    articles = cluster_articles(articles)
+    articles.sort(key=lambda a: a['published'], reverse=True)
+    return {'articles': articles, 'errors': errors, 'sources_checked': checked}
+
+
+def iter_feed_results(names, days=7):
+    """Fetch several feeds concurrently, yielding each fetch_feed() result as soon
+    as that feed finishes (completion order, not request order).
+
+    Lets callers stream articles to the client without waiting on the slowest
+    publisher. Deduplication across feeds is left to the caller.
+    """
+    names = list(dict.fromkeys(names))
+    if not names:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(names))) as pool:
+        futures = [pool.submit(fetch_feed, n, days) for n in names]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def dedupe_new_articles(articles, seen_links):
+    """Return articles whose normalized link isn't in seen_links, recording the new ones."""
+    fresh = []
+    for article in articles:
+        key = normalize_link(article['link'])
+        if key in seen_links:
+            continue
+        seen_links.add(key)
+        fresh.append(article)
+    return fresh
+
+
+def _result(name, articles=None, error=None):
+    return {
+        'source': name,
+        'success': error is None,
+        'articles': articles or [],
+        'error': error,
+    }
@@ -0,0 +1,59 @@
+"""Per-feed fetch state: HTTP validators, the entries parsed from the last body
+and the adaptive polling schedule.
+
+State is keyed by feed URL and always kept in-process, so a warm function
+instance can answer conditional GETs without a DB round trip. With
+USE_DATABASE=true it is also persisted to the matching `feeds` row (see
+db/migrations/003_feed_http_cache.sql and 005) so cold instances start warm.
+"""
+
+import os
+import threading
+
+USE_DATABASE = os.environ.get('USE_DATABASE', 'false').lower() == 'true'
+
+# Columns on the feeds row that make up a feed's fetch state
+STATE_FIELDS = {
+    'etag', 'last_modified', 'cached_entries', 'last_fetched_at', 'fetch_error',
+    'publish_interval_seconds', 'unchanged_polls', 'consecutive_failures', 'next_poll_at',
+}
+
+_state = {}
+_lock = threading.Lock()
+
+
+def get_feed_state(url):
+    """Return a copy of the stored state for a feed URL ({} if none)."""
+    with _lock:
+        state = _state.get(url)
+    if state is None and USE_DATABASE:
+        try:
+            from api.lib.supabase import get_feed_fetch_state
+            state = get_feed_fetch_state(url)
+        except Exception as e:
+            print(f"Error loading feed state for {url}: {e}")
+        if state:
+            with _lock:
+                _state.setdefault(url, state)
+    return dict(state) if state else {}
+
+
+def prime_feed_states(rows):
+    """Seed the in-process store from feeds rows already loaded (e.g. get_active_feeds()),
+    so a batch of lookups doesn't cost one query per feed."""
+    with _lock:
+        for row in rows:
+            if row.get('url'):
+                _state.setdefault(row['url'], {k: v for k, v in row.items() if k in STATE_FIELDS})
+
+
+def save_feed_state(url, **fields):
+    """Merge fields into the stored state for a feed URL and persist them."""
+    with _lock:
+        _state[url] = {**_state.get(url, {}), **fields}
+    if USE_DATABASE:
+        try:
+            from api.lib.supabase import update_feed_fetch_state
+            update_feed_fetch_state(url, fields)
+        except Exception as e:
+            print(f"Error saving feed state for {url}: {e}")
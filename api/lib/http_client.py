@@ -0,0 +1,95 @@
+"""Shared outbound HTTP client for feed and article fetches.
+
+One module-level pooled client per process, so repeated requests to the same
+host (medium.com alone serves nine feeds, substack.com several) reuse warm
+keep-alive connections instead of paying DNS + TCP + TLS setup every time.
+Concurrent requests per host are bounded by MAX_PER_HOST.
+
+HTTP/2 is optional: set HTTP2_ENABLED=true with httpx[http2] installed and
+requests are multiplexed over one connection per host. Otherwise (or if
+httpx is missing) a requests.Session with a sized connection pool is used.
+"""
+
+import os
+import threading
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+MAX_PER_HOST = int(os.environ.get('HTTP_MAX_PER_HOST', '6'))
+MAX_HOSTS = 64  # connection pools kept alive at once
+
+HTTP2_ENABLED = os.environ.get('HTTP2_ENABLED', 'false').lower() == 'true'
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+_client = None
+_client_lock = threading.Lock()
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+
+
+def _build_client():
+    if HTTP2_ENABLED and httpx is not None:
+        try:
+            return httpx.Client(
+                http2=True,
+                headers=DEFAULT_HEADERS,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=MAX_HOSTS * MAX_PER_HOST,
+                    max_keepalive_connections=MAX_HOSTS,
+                ),
+            )
+        except ImportError:
+            # httpx is installed without the h2 extra
+            print("HTTP2_ENABLED is set but h2 is not installed; using HTTP/1.1")
+
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    adapter = HTTPAdapter(pool_connections=MAX_HOSTS, pool_maxsize=MAX_PER_HOST)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_client():
+    """Return the process-wide pooled client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = _build_client()
+    return _client
+
+
+def _slots_for(url):
+    host = urlsplit(url).netloc.lower()
+    with _host_slots_lock:
+        slots = _host_slots.get(host)
+        if slots is None:
+            slots = _host_slots[host] = threading.BoundedSemaphore(MAX_PER_HOST)
+    return slots
+
+
+def http_get(url, headers=None, timeout=10):
+    """GET a URL through the shared client.
+
+    The response exposes .status_code, .headers, .content and
+    .raise_for_status() with either backend. Timeouts are always raised as
+    requests.exceptions.Timeout so callers only need to handle one type.
+    """
+    client = get_client()
+    with _slots_for(url):
+        if httpx is not None and isinstance(client, httpx.Client):
+            try:
+                return client.get(url, headers=headers, timeout=timeout)
+            except httpx.TimeoutException as e:
+                raise requests.exceptions.Timeout(str(e)) from e
+        return client.get(url, headers=headers, timeout=timeout)
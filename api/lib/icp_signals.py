@@ -0,0 +1,84 @@
+"""ICP pain-signal index.
+
+Turns an ICP profile's data (pain_points.top_pains,
+language_patterns.keywords_used, audience_overview.primary_identity) into
+the pain signals generate_impact() matches articles against: keyword lists
+paired with SMB impact statements.
+
+The index is built when a profile is saved (api/admin/icps.py) and stored on
+its `signal_index` column (migration 006), so enrichment loads it ready to
+use instead of re-deriving it from the profile JSON.
+"""
+
+# Bump when the derivation below changes; older stored indexes are rebuilt on load
+SIGNAL_INDEX_VERSION = 1
+
+MAX_PAIN_SIGNALS = 5         # top pain points turned into signals
+KEYWORDS_PER_PAIN = 3        # key terms taken from each pain point
+MAX_PROFILE_KEYWORDS = 10    # language_patterns keywords in the catch-all signal
+
+
+def build_signal_index(data):
+    """Derive the pain-signal index for a profile's `data` JSON.
+
+    Profile JSON is edited by hand, so missing or wrongly typed fields are
+    treated as empty rather than raising.
+    """
+    signals = []
+
+    pain_points = _strings(_field(data, 'pain_points', 'top_pains'))
+    keywords = _strings(_field(data, 'language_patterns', 'keywords_used'))
+    audience = _field(data, 'audience_overview', 'primary_identity')
+    if not isinstance(audience, str) or not audience.strip():
+        audience = 'your business'
+
+    # One signal per top pain point, keyed on its longer words
+    for pain in pain_points[:MAX_PAIN_SIGNALS]:
+        pain_keywords = [w.lower() for w in pain.split() if len(w) > 4][:KEYWORDS_PER_PAIN]
+        if pain_keywords:
+            signals.append({
+                'keywords': pain_keywords,
+                'smb_impact': f"For {audience} dealing with {pain.lower()}, this development could offer relevant solutions or insights. Evaluate how it addresses this specific challenge in your business context.",
+            })
+
+    # Catch-all signal for the profile's own vocabulary
+    if keywords:
+        signals.append({
+            'keywords': [k.lower() for k in keywords[:MAX_PROFILE_KEYWORDS]],
+            'smb_impact': f"This touches on topics relevant to {audience}. Consider how these developments apply to your specific industry context and operational needs.",
+        })
+
+    return {'version': SIGNAL_INDEX_VERSION, 'signals': signals}
+
+
+def profile_signals(profile):
+    """Pain signals for a stored profile row: its saved index, rebuilt if missing,
+    stale or malformed."""
+    index = profile.get('signal_index')
+    if not _valid_index(index):
+        index = build_signal_index(profile.get('data'))
+    return index['signals']
+
+
+def _field(data, section, key):
+    """data[section][key], or None if either level is missing or not an object."""
+    section = data.get(section) if isinstance(data, dict) else None
+    return section.get(key) if isinstance(section, dict) else None
+
+
+def _strings(value):
+    """The non-empty strings in a JSON list; anything else is dropped."""
+    if not isinstance(value, list):
+        return []
+    return [v for v in value if isinstance(v, str) and v.strip()]
+
+
+def _valid_index(index):
+    if not isinstance(index, dict) or index.get('version') != SIGNAL_INDEX_VERSION:
+        return False
+    signals = index.get('signals')
+    return isinstance(signals, list) and all(
+        isinstance(s, dict) and isinstance(s.get('smb_impact'), str)
+        and isinstance(s.get('keywords'), list) and all(isinstance(k, str) for k in s['keywords'])
+        for s in signals
+    )
@@ -0,0 +1,88 @@
+"""Incremental reader for a streamed JSON object with a list of sections.
+
+The executive summary arrives from Claude as one JSON document:
+    {"title": ..., "subtitle": ..., "sections": [{...}, {...}, ...]}
+Waiting for the closing brace means waiting for the whole response.
+SectionParser is fed the text as it streams and hands back each part as soon
+as it is complete: the fields before the list (once the list opens) and then
+every section object as its closing brace arrives. Text outside the top-level
+object (a markdown fence the model added anyway) is ignored.
+"""
+
+import json
+
+
+class SectionParser:
+    def __init__(self, key='sections'):
+        self.key = key
+        self._buffer = ''
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = None
+        self._last_string = None      # (text, start index) of the last complete string
+        self._object_start = None     # index of the top-level '{'
+        self._list_depth = None       # depth inside the sections list while it is open
+        self._list_done = False
+        self._item_start = None
+
+    def feed(self, text):
+        """Add streamed text. Returns [(kind, value)] for parts completed by it:
+        ('head', dict of the fields before the list) once, then ('section', dict)."""
+        self._buffer += text
+        buf = self._buffer
+        parts = []
+        for i in range(self._pos, len(buf)):
+            c = buf[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    self._last_string = (buf[self._string_start + 1:i], self._string_start)
+                continue
+
+            if c == '"':
+                self._in_string = True
+                self._string_start = i
+            elif c == '{' or c == '[':
+                if self._depth == 0 and c == '{':
+                    self._object_start = i
+                elif (c == '[' and self._depth == 1 and not self._list_done
+                        and self._last_string and self._last_string[0] == self.key):
+                    self._list_depth = 2
+                    head = self._parse_head(self._last_string[1])
+                    if head is not None:
+                        parts.append(('head', head))
+                self._depth += 1
+                if c == '{' and self._list_depth is not None and self._depth == self._list_depth + 1:
+                    self._item_start = i
+            elif c == '}' or c == ']':
+                if c == '}' and self._item_start is not None and self._depth == self._list_depth + 1:
+                    section = self._parse(buf[self._item_start:i + 1])
+                    if isinstance(section, dict):
+                        parts.append(('section', section))
+                    self._item_start = None
+                self._depth -= 1
+                if self._list_depth is not None and self._depth < self._list_depth:
+                    self._list_depth = None
+                    self._list_done = True  # later lists don't count
+        self._pos = len(buf)
+        return parts
+
+    def _parse_head(self, key_start):
+        if self._object_start is None:
+            return None
+        head = self._buffer[self._object_start:key_start].rstrip().rstrip(',') + '}'
+        parsed = self._parse(head)
+        return parsed if isinstance(parsed, dict) else None
+
+    @staticmethod
+    def _parse(text):
+        try:
+            return json.loads(text)
+        except ValueError:
+            return None
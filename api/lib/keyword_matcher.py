@@ -0,0 +1,88 @@
+"""Multi-keyword matcher for article enrichment.
+
+All of the enrichment keyword lists (AI, SMB, viral, topic words, ICP pain
+signals, content-suggestion triggers) are compiled into one matcher, so an
+article's text is tokenized once and every list is answered from the
+resulting hit set instead of re-scanning the text per list.
+
+Matching is on whole words, not substrings: 'ai' no longer hits "said" or
+"again", 'eu' no longer hits "neural", 'app' no longer hits "happen". Text
+and keywords are split on anything that isn't a letter or digit, so
+'game-changing' and 'open source' match their hyphenated/spaced forms.
+Single-word keywords are a token-set lookup; phrases are checked only where
+their first word occurs.
+
+A word also matches a keyword it inflects: plurals ("models" -> model,
+"launches" -> launch) and, for stems of 4+ letters, -ed / -ing forms
+("raised" -> raise, "launching" -> launch). Derived nouns aren't folded in
+("investor" is not a form of invest, nor "government" of govern), so lists
+name them explicitly. Short keywords (ai, eu, app, gpt) only match exactly or, past 3 letters,
+with a plural s.
+"""
+
+import re
+from functools import lru_cache
+
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+# Suffixes stripped from a word's end when the remaining stem is at least
+# MIN_STEM letters; -ed / -ing also try the stem + 'e' (raised -> raise)
+SUFFIXES = ('ing', 'ed')
+MIN_STEM = 4
+
+
+def tokenize(text):
+    """Lowercase letter/digit runs of a string."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+@lru_cache(maxsize=65536)
+def word_forms(word):
+    """The word plus the base forms it may be an inflection of."""
+    forms = {word}
+    if len(word) > 3 and word.endswith('s'):
+        forms.add(word[:-1])
+        if word.endswith('es'):
+            forms.add(word[:-2])
+    for form in list(forms):
+        for suffix in SUFFIXES:
+            stem = form[:-len(suffix)]
+            if form.endswith(suffix) and len(stem) >= MIN_STEM:
+                forms.add(stem)
+                if suffix in ('ed', 'ing'):
+                    forms.add(stem + 'e')
+    return frozenset(forms)
+
+
+class KeywordMatcher:
+    """Compiled set of keywords. find(text) returns the keywords occurring in text."""
+
+    def __init__(self, keywords):
+        self.keywords = frozenset(k.lower() for k in keywords if k)
+        self._words = {}    # token -> keywords that are exactly that one word
+        self._phrases = {}  # first token -> [(tokens, keyword)] for multi-word keywords
+        for keyword in self.keywords:
+            tokens = tuple(tokenize(keyword))
+            if len(tokens) == 1:
+                self._words.setdefault(tokens[0], set()).add(keyword)
+            elif tokens:
+                self._phrases.setdefault(tokens[0], []).append((tokens, keyword))
+
+    def find(self, text):
+        tokens = tokenize(text)
+        words, phrases = self._words, self._phrases
+        hits = set()
+        for token in set(tokens):
+            for form in word_forms(token):
+                matched = words.get(form)
+                if matched:
+                    hits.update(matched)
+        if phrases:
+            # The last word of a phrase may be inflected, the rest must be exact
+            for i, token in enumerate(tokens):
+                for phrase, keyword in phrases.get(token, ()):
+                    end = i + len(phrase) - 1
+                    if (end < len(tokens) and tuple(tokens[i + 1:end]) == phrase[1:-1]
+                            and phrase[-1] in word_forms(tokens[end])):
+                        hits.add(keyword)
+        return hits
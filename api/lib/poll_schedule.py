@@ -0,0 +1,82 @@
+"""Adaptive per-feed polling schedule.
+
+Each feed's publish interval is learned from the entry timestamps in its last
+body, and the next poll is set to roughly half that interval, clamped to
+[MIN_POLL_SECONDS, MAX_POLL_SECONDS]. Polls that find nothing new (304 or an
+unchanged newest entry) and failed polls back off exponentially, so quiet or
+broken feeds are checked less and less often.
+
+Everything here is pure: callers pass the stored feed state in and persist
+the returned fields (see api/lib/feed_state.py).
+"""
+
+from datetime import datetime, timedelta, timezone
+from statistics import median
+
+MIN_POLL_SECONDS = 15 * 60          # never poll a feed more than every 15 minutes
+MAX_POLL_SECONDS = 24 * 60 * 60     # always check at least daily
+DEFAULT_INTERVAL_SECONDS = 6 * 60 * 60  # before we've seen enough entries to learn
+MAX_BACKOFF_STEPS = 5
+
+
+def estimate_publish_interval(articles):
+    """Median gap in seconds between consecutive entries, or None if < 2 dated entries."""
+    stamps = sorted(datetime.fromisoformat(a['published']) for a in articles)
+    gaps = [(b - a).total_seconds() for a, b in zip(stamps, stamps[1:])]
+    gaps = [g for g in gaps if g > 0]
+    return median(gaps) if gaps else None
+
+
+def latest_published(articles):
+    """ISO timestamp of the newest entry, or None."""
+    return max((a['published'] for a in articles or []), default=None)
+
+
+def schedule_next_poll(state, outcome, articles=None, now=None):
+    """Work out the next poll time after a fetch.
+
+    outcome: 'fetched' (200 with a parsed body), 'not_modified' (304) or 'failed'.
+    A 'fetched' poll whose newest entry is no newer than the cached copy's
+    counts as unchanged for backoff purposes.
+
+    Returns the state fields to persist: publish_interval_seconds,
+    unchanged_polls, consecutive_failures, next_poll_at.
+    """
+    now = now or datetime.now(timezone.utc)
+    interval = state.get('publish_interval_seconds') or DEFAULT_INTERVAL_SECONDS
+    unchanged = state.get('unchanged_polls') or 0
+    failures = state.get('consecutive_failures') or 0
+
+    if outcome == 'failed':
+        failures += 1
+    else:
+        failures = 0
+        changed = False
+        if outcome == 'fetched':
+            learned = estimate_publish_interval(articles or [])
+            if learned:
+                interval = learned
+            previous = latest_published(state.get('cached_entries'))
+            newest = latest_published(articles)
+            changed = newest is not None and (previous is None or newest > previous)
+        unchanged = 0 if changed else unchanged + 1
+
+    delay = min(max(interval / 2, MIN_POLL_SECONDS), MAX_POLL_SECONDS)
+    steps = min(unchanged + failures, MAX_BACKOFF_STEPS)
+    delay = min(delay * (2 ** steps), MAX_POLL_SECONDS)
+
+    return {
+        'publish_interval_seconds': int(interval),
+        'unchanged_polls': unchanged,
+        'consecutive_failures': failures,
+        'next_poll_at': (now + timedelta(seconds=delay)).isoformat(),
+    }
+
+
+def is_poll_due(state, now=None):
+    """True if the feed has never been scheduled or its next poll time has passed."""
+    next_poll_at = state.get('next_poll_at')
+    if not next_poll_at:
+        return True
+    now = now or datetime.now(timezone.utc)
+    return datetime.fromisoformat(next_poll_at) <= now
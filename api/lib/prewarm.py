@@ -0,0 +1,131 @@
+"""Pre-generate TL;DR summaries for the top stories of an ingestion run.
+
+A TL;DR click costs an article scrape plus a full Claude call. After each
+ingestion run the PREWARM_TOP_N best new stories (source priority, then
+viral score, then SMB score, newest first) get their TL;DR generated and
+stored in the summary cache (api/lib/summary_cache.py), so the first
+reader's click is a cache hit.
+
+Spend is capped per run by PREWARM_TOKEN_BUDGET. Each summary reserves its
+worst case (estimated prompt tokens plus the full output allowance) before
+the Claude call, and stories that no longer fit are left for on-click
+generation. Time is capped the same way when the caller passes a deadline
+(the ingest cron's maxDuration): a scrape or Claude call only starts if its
+worst case still fits before it.
+
+The cache must be one the digest's /api/summarize instances can read: on
+Vercel that means SUMMARY_CACHE=supabase, so with the per-instance SQLite
+store pre-warming is skipped there.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from api.lib.summary_cache import SUMMARY_CACHE, get_summary, save_summary
+
+PREWARM_TOP_N = int(os.environ.get('PREWARM_TOP_N', '5'))
+PREWARM_TOKEN_BUDGET = int(os.environ.get('PREWARM_TOKEN_BUDGET', '40000'))
+
+# Summaries run concurrently so a handful fit in the ingest cron's maxDuration
+PREWARM_WORKERS = 5
+
+CHARS_PER_TOKEN = 4
+TLDR_PROMPT_TOKENS = 250     # the prompt template around the article text
+TLDR_OUTPUT_TOKENS = 1024    # max_tokens of generate_tldr_summary()
+
+# Worst-case seconds of each step, checked against the deadline
+FETCH_SECONDS = 10           # http_get timeout of fetch_article_content()
+TLDR_SECONDS = 30            # a TL;DR call writing its full output allowance
+
+
+def select_top_stories(articles, n=PREWARM_TOP_N):
+    """The n stories most likely to be opened first."""
+    ranked = sorted(articles, key=lambda a: a.get('published', ''), reverse=True)
+    ranked.sort(key=lambda a: (a.get('priority', 99), -a.get('viral_score', 0), -a.get('smb_score', 0)))
+    return ranked[:n]
+
+
+def estimate_tldr_tokens(article_text):
+    """Worst-case tokens of one TL;DR call: prompt plus the full output allowance."""
+    return len(article_text) // CHARS_PER_TOKEN + TLDR_PROMPT_TOKENS + TLDR_OUTPUT_TOKENS
+
+
+class TokenBudget:
+    """Thread-safe running total of tokens reserved against a cap."""
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.reserved = 0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens):
+        """Reserve tokens if they fit; returns whether they did."""
+        with self._lock:
+            if self.reserved + tokens > self.limit:
+                return False
+            self.reserved += tokens
+            return True
+
+
+def prewarm_summaries(articles, top_n=PREWARM_TOP_N, token_budget=PREWARM_TOKEN_BUDGET,
+                      deadline=None):
+    """Generate and cache TL;DRs for the top stories among `articles`.
+
+    `deadline` is a time.monotonic() value that every started step must
+    finish by; None means no limit. Never raises. Returns { generated,
+    cached, over_budget, out_of_time, errors, tokens_reserved } or
+    { skipped: reason }.
+    """
+    if top_n <= 0 or not articles:
+        return {'skipped': 'nothing to pre-warm'}
+    if not os.environ.get('ANTHROPIC_API_KEY'):
+        return {'skipped': 'ANTHROPIC_API_KEY not configured'}
+    if SUMMARY_CACHE == 'off':
+        return {'skipped': 'summary cache is off'}
+    if SUMMARY_CACHE != 'supabase' and os.environ.get('VERCEL'):
+        return {'skipped': 'summary cache is not shared across instances (set SUMMARY_CACHE=supabase)'}
+
+    # Imported here: the summarize handler module pulls in anthropic and bs4
+    from api.summarize import (
+        PROMPT_VERSIONS, SUMMARY_MODEL, fetch_article_content, generate_tldr_summary,
+    )
+    prompt_version = PROMPT_VERSIONS['tldr']
+    budget = TokenBudget(token_budget)
+
+    def fits(seconds):
+        return deadline is None or time.monotonic() + seconds <= deadline
+
+    def prewarm(article):
+        url = article['link']
+        if get_summary(url, 'tldr', prompt_version, SUMMARY_MODEL) is not None:
+            return 'cached'
+        if not fits(FETCH_SECONDS + TLDR_SECONDS):
+            return 'out_of_time'
+        article_text = fetch_article_content(url)['text']
+        if not article_text:
+            raise Exception("No content could be extracted from the article")
+        if not fits(TLDR_SECONDS):
+            return 'out_of_time'
+        if not budget.reserve(estimate_tldr_tokens(article_text)):
+            return 'over_budget'
+        summary = generate_tldr_summary(article_text, article.get('title', 'Article'), url)
+        save_summary(url, 'tldr', prompt_version, SUMMARY_MODEL, summary)
+        return 'generated'
+
+    def run(article):
+        try:
+            return prewarm(article), None
+        except Exception as e:
+            return 'error', {'link': article.get('link'), 'error': str(e)[:100]}
+
+    stats = {'generated': 0, 'cached': 0, 'over_budget': 0, 'out_of_time': 0, 'errors': []}
+    stories = select_top_stories(articles, top_n)
+    with ThreadPoolExecutor(max_workers=min(PREWARM_WORKERS, len(stories))) as pool:
+        for outcome, error in pool.map(run, stories):
+            if error:
+                stats['errors'].append(error)
+            else:
+                stats[outcome] += 1
+    stats['tokens_reserved'] = budget.reserved
+    return stats
@@ -0,0 +1,58 @@
+"""In-process request coalescing.
+
+SingleFlight.do(key, fn) runs fn once per key at a time: callers that arrive
+while a call for the same key is in flight wait for it and get its result (or
+its exception) instead of starting their own. Once the call finishes the key
+is released, so a later caller runs fn again — pair it with a cache to reuse
+results beyond the in-flight window.
+"""
+
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """Run fn() for key, or wait on the call already running for it.
+
+        Returns (result, shared): shared is True for callers that waited on
+        another caller's call. An exception raised by fn is raised in every
+        caller sharing the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self):
+        """Number of keys with a call running."""
+        with self._lock:
+            return len(self._calls)
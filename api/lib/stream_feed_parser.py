@@ -0,0 +1,220 @@
+"""Incremental RSS/Atom parser for the feed fetch path.
+
+feedparser builds a full document model (and sanitizes every HTML fragment)
+before handing back entries; for large feeds with full-text content that is
+most of the fetch cost. This parser walks the body with ElementTree.iterparse,
+keeps only the fields parse_feed_entries() reads (title, link, id, summary,
+dates) and discards each item's subtree as soon as it has been read, so peak
+memory stays near one item rather than one document.
+
+It handles RSS 2.0, RSS 1.0 (RDF) and Atom. Anything it can't read — a
+malformed body, an unknown root element — returns None so the caller falls
+back to feedparser.
+"""
+
+import io
+import xml.etree.ElementTree as ET
+from api.lib.dates import parse_date
+
+CONTENT_NS = 'http://purl.org/rss/1.0/modules/content/'
+DC_NS = 'http://purl.org/dc/elements/1.1/'
+DCTERMS_NS = 'http://purl.org/dc/terms/'
+MEDIA_NS = 'http://search.yahoo.com/mrss/'
+ITUNES_NS = 'http://www.itunes.com/dtds/podcast-1.0.dtd'
+
+# Namespaces whose elements are read by their local name: none (RSS 0.9x/2.0),
+# Atom 1.0 and 0.3, RSS 1.0 and 0.90
+_CORE_NS = {
+    'http://www.w3.org/2005/Atom', 'http://purl.org/atom/ns#',
+    'http://purl.org/rss/1.0/', 'http://my.netscape.com/rdf/simple/0.9/',
+}
+# The only other elements read, by the field they fill. Extension titles and
+# descriptions get fields of their own and only stand in when the entry has
+# no core one (YouTube puts its only description in media:group), so e.g. an
+# itunes:title can't replace the real title.
+_NS_FIELDS = {
+    (CONTENT_NS, 'encoded'): 'content',
+    (DC_NS, 'title'): 'dc_title',
+    (DC_NS, 'description'): 'dc_description',
+    (DC_NS, 'date'): 'date',
+    (DCTERMS_NS, 'issued'): 'issued',
+    (DCTERMS_NS, 'modified'): 'modified',
+    (MEDIA_NS, 'title'): 'media_title',
+    (MEDIA_NS, 'description'): 'media_description',
+    (MEDIA_NS, 'group'): 'media_group',
+    (ITUNES_NS, 'summary'): 'itunes_summary',
+}
+# Fallbacks for a missing core field, in preference order
+_TITLE_FALLBACKS = ('dc_title', 'media_title')
+_SUMMARY_FALLBACKS = ('dc_description', 'media_description', 'itunes_summary')
+
+_ENTRY_TAGS = {'item', 'entry'}
+# Fields whose value may be inline markup (Atom type="html"/"xhtml" and
+# feeds that embed unescaped HTML) rather than plain text
+_MARKUP_FIELDS = {'title', 'description', 'summary', 'content', 'dc_title', 'dc_description'}
+_VERSIONS = {'rss': 'rss20', 'RDF': 'rss10', 'feed': 'atom10'}
+
+# Source fields for each output date, in preference order
+_DATE_FIELDS = {
+    'published': ('pubDate', 'published', 'issued', 'date'),
+    'updated': ('updated', 'modified'),
+}
+
+
+class FeedEntry(dict):
+    """Entry dict with attribute access, mirroring feedparser's FeedParserDict."""
+
+    def __getattr__(self, key):
+        try:
+            return self[key]
+        except KeyError:
+            raise AttributeError(key)
+
+
+class ParsedFeed:
+    """Minimal stand-in for feedparser's result: .entries, .bozo, .version."""
+
+    bozo = False
+
+    def __init__(self, entries, version):
+        self.entries = entries
+        self.version = version
+
+
+def parse(content, source=None):
+    """Parse a feed body (bytes). Returns a ParsedFeed, or None if it can't.
+
+    `source` (the feed name) keys the memoized date format in api/lib/dates.py.
+    """
+    try:
+        return _parse(content, source)
+    except ET.ParseError:
+        return None
+
+
+def _parse(content, source):
+    entries = []
+    stack = []
+    version = None
+
+    for event, elem in ET.iterparse(io.BytesIO(content), events=('start', 'end')):
+        if event == 'start':
+            if version is None:
+                version = _VERSIONS.get(_local(elem.tag))
+                if version is None:
+                    return None
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        if _local(elem.tag) in _ENTRY_TAGS:
+            entries.append(_read_entry(elem, source))
+            # Drop the item's subtree now that its fields are copied out
+            if stack:
+                stack[-1].remove(elem)
+            elem.clear()
+
+    return ParsedFeed(entries, version)
+
+
+def _read_entry(elem, source):
+    fields = {}
+    link = None
+    content = None
+
+    for child in _entry_children(elem):
+        tag = _field_name(child.tag)
+        if tag is None:
+            continue
+        if len(child) and tag in _MARKUP_FIELDS:
+            text = _inner_markup(child).strip()
+        else:
+            text = (child.text or '').strip()
+
+        if tag == 'link':
+            # Atom: <link rel="alternate" href="..."/>; RSS: <link>url</link>
+            href = child.get('href')
+            if href is not None:
+                if child.get('rel', 'alternate') == 'alternate' or link is None:
+                    link = href
+            elif text:
+                link = text
+        elif tag == 'guid' or tag == 'id':
+            fields.setdefault('id', text)
+            if tag == 'guid' and child.get('isPermaLink', 'true') != 'false':
+                fields.setdefault('_permalink', text)
+        elif tag in ('description', 'summary'):
+            fields.setdefault('summary', text)
+        elif tag == 'content':
+            content = content or text
+        else:
+            fields.setdefault(tag, text)
+
+    entry = FeedEntry()
+    title = fields.get('title')
+    if title is None:
+        title = next((fields[f] for f in _TITLE_FALLBACKS if fields.get(f)), None)
+    if title is not None:
+        entry['title'] = title
+    link = link or fields.get('_permalink')
+    if link:
+        entry['link'] = link
+    if fields.get('id'):
+        entry['id'] = fields['id']
+    # A core summary wins even when empty, as in feedparser
+    summary = fields.get('summary')
+    if summary is None:
+        summary = (next((fields[f] for f in _SUMMARY_FALLBACKS if fields.get(f)), None)
+                   or content)
+    if summary:
+        entry['summary'] = summary
+
+    for out, sources in _DATE_FIELDS.items():
+        raw = next((fields[s] for s in sources if fields.get(s)), None)
+        if raw:
+            entry[out] = raw
+            parsed = parse_date(raw, source=source)
+            if parsed:
+                # UTC struct_time, like feedparser's *_parsed fields
+                entry[out + '_parsed'] = parsed.timetuple()
+    return entry
+
+
+def _inner_markup(elem):
+    """An element's child content as an HTML string, the way feedparser returns
+    Atom xhtml content: the wrapping <div> is dropped and so are namespaces."""
+    if elem.get('type') == 'xhtml' and len(elem) == 1 and _local(elem[0].tag) == 'div':
+        elem = elem[0]
+    # The subtree is discarded after reading, so rename its tags in place
+    for node in elem.iter():
+        node.tag = _local(node.tag)
+    return (elem.text or '') + ''.join(ET.tostring(child, encoding='unicode') for child in elem)
+
+
+def _entry_children(elem):
+    """An entry's child elements, with those of a media:group read in its place."""
+    for child in elem:
+        if _field_name(child.tag) == 'media_group':
+            yield from child
+        else:
+            yield child
+
+
+_field_names = {}
+
+
+def _field_name(tag):
+    """The field an entry child element fills, or None to skip it (memoized per tag)."""
+    name = _field_names.get(tag, False)
+    if name is False:
+        if tag[0] != '{':
+            name = tag
+        else:
+            ns, local = tag[1:].split('}', 1)
+            name = local if ns in _CORE_NS else _NS_FIELDS.get((ns, local))
+        _field_names[tag] = name
+    return name
+
+
+def _local(tag):
+    return tag.rsplit('}', 1)[-1]
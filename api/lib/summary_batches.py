@@ -0,0 +1,165 @@
+"""Batch summarization through the Message Batches API.
+
+Generating summaries for a whole day's articles one messages.create() call
+at a time is slow and billed at the full rate. This pipeline builds the same
+prompts summarize.py sends (summary_request()), submits them as one
+asynchronous Message Batch, polls until the batch has ended and writes each
+successful result into the summary cache (api/lib/summary_cache.py) under
+the key /api/summarize looks up.
+
+Each request's custom_id is its summary cache key, so a batch can be
+collected again later (collect_batch()) from its id and the manifest of
+(url, type) pairs written at submit time.
+
+The client honours ANTHROPIC_BASE_URL (or base_url=), so the whole flow can
+run against scripts/stub_batch_server.py instead of the real API.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+import anthropic
+from api.lib.summary_cache import cache_key, get_summary, save_summary
+
+BATCH_MAX_REQUESTS = 10000   # per submitted batch; the API allows up to 100,000
+FETCH_WORKERS = 8
+POLL_INTERVAL_SECONDS = 30
+POLL_TIMEOUT_SECONDS = 24 * 3600  # batches expire after 24 hours
+
+
+def get_client(base_url=None):
+    api_key = os.environ.get('ANTHROPIC_API_KEY')
+    if not api_key:
+        raise Exception("ANTHROPIC_API_KEY not configured")
+    client = anthropic.Anthropic(api_key=api_key, base_url=base_url)
+    # Older SDKs only have it as client.beta.messages.batches, or not at all
+    if not hasattr(client.messages, 'batches'):
+        raise Exception(f"anthropic>=0.41.0 is required for Message Batches (installed: {anthropic.__version__})")
+    return client
+
+
+def pending_summaries(articles, summary_types):
+    """(article, summary_type) pairs that aren't in the summary cache yet."""
+    from api.summarize import PROMPT_VERSIONS, SUMMARY_MODEL
+    pending = []
+    for article in articles:
+        for summary_type in summary_types:
+            if get_summary(article['link'], summary_type, PROMPT_VERSIONS[summary_type], SUMMARY_MODEL) is None:
+                pending.append((article, summary_type))
+    return pending
+
+
+def build_requests(pending):
+    """Fetch each article once and build its batch requests.
+
+    Returns (requests, manifest, errors): manifest maps custom_id to
+    {url, type}; articles that can't be fetched are reported in errors.
+    """
+    from api.summarize import PROMPT_VERSIONS, SUMMARY_MODEL, fetch_article_content, summary_request
+
+    urls = list(dict.fromkeys(article['link'] for article, _ in pending))
+
+    def fetch(url):
+        try:
+            return url, fetch_article_content(url)['text'], None
+        except Exception as e:
+            return url, None, str(e)[:100]
+
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as pool:
+        fetched = {url: (text, error) for url, text, error in pool.map(fetch, urls)}
+
+    requests, manifest, errors = [], {}, []
+    for article, summary_type in pending:
+        url = article['link']
+        text, error = fetched[url]
+        if not text:
+            errors.append({'link': url, 'type': summary_type,
+                           'error': error or 'No content could be extracted from the article'})
+            continue
+        custom_id = cache_key(url, summary_type, PROMPT_VERSIONS[summary_type], SUMMARY_MODEL)
+        if custom_id in manifest:
+            continue
+        manifest[custom_id] = {'url': url, 'type': summary_type}
+        requests.append({
+            'custom_id': custom_id,
+            'params': summary_request(summary_type, text, article.get('title', 'Article'), url),
+        })
+    return requests, manifest, errors
+
+
+def submit_batches(client, requests):
+    """Submit requests in chunks of BATCH_MAX_REQUESTS; returns the batch ids."""
+    batch_ids = []
+    for i in range(0, len(requests), BATCH_MAX_REQUESTS):
+        batch = client.messages.batches.create(requests=requests[i:i + BATCH_MAX_REQUESTS])
+        batch_ids.append(batch.id)
+    return batch_ids
+
+
+def wait_for_batch(client, batch_id, poll_interval=POLL_INTERVAL_SECONDS, timeout=POLL_TIMEOUT_SECONDS):
+    """Poll until the batch has ended; returns the final batch object.
+
+    Raises TimeoutError if it is still processing after `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        batch = client.messages.batches.retrieve(batch_id)
+        if batch.processing_status == 'ended':
+            return batch
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Batch {batch_id} still {batch.processing_status} after {timeout}s")
+        time.sleep(poll_interval)
+
+
+def collect_batch(client, batch_id, manifest):
+    """Write an ended batch's successful results into the summary cache.
+
+    Returns { succeeded, errored, expired, canceled, unparsable, unknown }.
+    """
+    from api.summarize import PROMPT_VERSIONS, SUMMARY_MODEL, render_summary
+
+    counts = {'succeeded': 0, 'errored': 0, 'expired': 0, 'canceled': 0, 'unparsable': 0, 'unknown': 0}
+    for entry in client.messages.batches.results(batch_id):
+        request = manifest.get(entry.custom_id)
+        if request is None:
+            counts['unknown'] += 1
+            continue
+        if entry.result.type != 'succeeded':
+            counts[entry.result.type] = counts.get(entry.result.type, 0) + 1
+            continue
+        try:
+            summary = render_summary(request['type'], entry.result.message.content[0].text)
+        except Exception:
+            counts['unparsable'] += 1
+            continue
+        save_summary(request['url'], request['type'], PROMPT_VERSIONS[request['type']], SUMMARY_MODEL, summary)
+        counts['succeeded'] += 1
+    return counts
+
+
+def run_batch_summaries(articles, summary_types=('tldr',), client=None,
+                        poll_interval=POLL_INTERVAL_SECONDS, timeout=POLL_TIMEOUT_SECONDS,
+                        on_submit=None):
+    """Summarize every uncached (article, type) pair through Message Batches.
+
+    `on_submit(batch_ids, manifest)` is called once the batches are created,
+    e.g. to save a manifest for collect_batch() in case polling is cut short.
+
+    Returns { pending, submitted, batch_ids, fetch_errors, results }.
+    """
+    client = client or get_client()
+    pending = pending_summaries(articles, summary_types)
+    requests, manifest, fetch_errors = build_requests(pending)
+    summary = {'pending': len(pending), 'submitted': len(requests), 'batch_ids': [],
+               'fetch_errors': fetch_errors, 'results': {}}
+    if not requests:
+        return summary
+
+    summary['batch_ids'] = submit_batches(client, requests)
+    if on_submit:
+        on_submit(summary['batch_ids'], manifest)
+    for batch_id in summary['batch_ids']:
+        wait_for_batch(client, batch_id, poll_interval, timeout)
+        for key, count in collect_batch(client, batch_id, manifest).items():
+            summary['results'][key] = summary['results'].get(key, 0) + count
+    return summary
@@ -0,0 +1,186 @@
+"""Cache of generated article summaries for /api/summarize.
+
+A summary is a pure function of the article, the summary type, the prompt
+and the model, so it is stored under a hash of (normalized URL, type, prompt
+version, model): a repeat click, from any reader, is answered from the cache
+without re-scraping the article or calling Claude. Changing a prompt means
+bumping its PROMPT_VERSION in summarize.py, which moves it to fresh keys.
+
+Entries expire after SUMMARY_CACHE_TTL_SECONDS, and the store is bounded to
+SUMMARY_CACHE_MAX_ENTRIES by evicting the least recently read. The Supabase
+store keeps both off the request path: a read records itself only when the
+entry's last recorded read is over TOUCH_INTERVAL_SECONDS old, and each
+instance evicts at most once per EVICT_INTERVAL_SECONDS, so the table can
+briefly run past the bound by the summaries written in between.
+
+SUMMARY_CACHE selects the store:
+    sqlite    (default) a SQLite file at SUMMARY_CACHE_PATH, shared by every
+              request a warm instance serves
+    supabase  the summary_cache table (migration 008), shared by all instances
+    off       no caching
+Cache errors are logged and treated as a miss; they never fail a request.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from api.shared import normalize_link
+
+SUMMARY_CACHE = os.environ.get('SUMMARY_CACHE', 'sqlite').lower()
+SUMMARY_CACHE_PATH = os.environ.get('SUMMARY_CACHE_PATH', '/tmp/ai-digest-summaries.sqlite3')
+SUMMARY_CACHE_TTL_SECONDS = int(os.environ.get('SUMMARY_CACHE_TTL_SECONDS', 7 * 24 * 3600))
+SUMMARY_CACHE_MAX_ENTRIES = int(os.environ.get('SUMMARY_CACHE_MAX_ENTRIES', 5000))
+# Supabase store: LRU order is kept to this resolution, which spares a hot
+# entry an UPDATE round trip on every read
+TOUCH_INTERVAL_SECONDS = 3600
+EVICT_INTERVAL_SECONDS = 600
+
+
+def cache_key(url, summary_type, prompt_version, model):
+    """Content address of a summary: sha256 of its normalized inputs."""
+    parts = (normalize_link(url), summary_type, str(prompt_version), model)
+    return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+
+class SQLiteSummaryStore:
+    """Summaries in a local SQLite file. One connection per process, behind a lock."""
+
+    def __init__(self, path, ttl_seconds, max_entries):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS summary_cache ('
+            ' key TEXT PRIMARY KEY, summary TEXT NOT NULL,'
+            ' created_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_summary_cache_accessed ON summary_cache(accessed_at)'
+        )
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT summary, created_at FROM summary_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl_seconds:
+                self._conn.execute('DELETE FROM summary_cache WHERE key = ?', (key,))
+                return None
+            self._conn.execute('UPDATE summary_cache SET accessed_at = ? WHERE key = ?', (now, key))
+        return row[0]
+
+    def put(self, key, summary, **details):
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO summary_cache (key, summary, created_at, accessed_at)'
+                ' VALUES (?, ?, ?, ?)', (key, summary, now, now)
+            )
+            # Expired entries first, then least recently read beyond the bound
+            self._conn.execute(
+                'DELETE FROM summary_cache WHERE created_at < ?', (now - self.ttl_seconds,)
+            )
+            self._conn.execute(
+                'DELETE FROM summary_cache WHERE key IN (SELECT key FROM summary_cache'
+                ' ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)', (self.max_entries,)
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM summary_cache').fetchone()[0]
+
+
+class SupabaseSummaryStore:
+    """Summaries in the summary_cache table (migration 008)."""
+
+    def __init__(self, ttl_seconds, max_entries):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # Monotonic time of this instance's last eviction (None: not yet)
+        self._evicted_at = None
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        from api.lib.supabase import get_cached_summary, touch_cached_summary, delete_cached_summary
+        row = get_cached_summary(key)
+        if row is None:
+            return None
+        now = datetime.now(timezone.utc)
+        if now - datetime.fromisoformat(row['created_at']) > timedelta(seconds=self.ttl_seconds):
+            delete_cached_summary(key)
+            return None
+        accessed_at = row.get('accessed_at')
+        if (accessed_at is None or now - datetime.fromisoformat(accessed_at)
+                > timedelta(seconds=TOUCH_INTERVAL_SECONDS)):
+            touch_cached_summary(key)
+        return row['summary']
+
+    def put(self, key, summary, **details):
+        from api.lib.supabase import save_cached_summary, evict_cached_summaries
+        save_cached_summary({'key': key, 'summary': summary, **details})
+        if self._eviction_due():
+            expired_before = datetime.now(timezone.utc) - timedelta(seconds=self.ttl_seconds)
+            evict_cached_summaries(expired_before.isoformat(), self.max_entries)
+
+    def _eviction_due(self):
+        """True at most once per EVICT_INTERVAL_SECONDS per instance."""
+        now = time.monotonic()
+        with self._lock:
+            if self._evicted_at is not None and now - self._evicted_at < EVICT_INTERVAL_SECONDS:
+                return False
+            self._evicted_at = now
+            return True
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """The configured store, created on first use (None when caching is off)."""
+    global _store
+    if _store is None and SUMMARY_CACHE != 'off':
+        with _store_lock:
+            if _store is None:
+                if SUMMARY_CACHE == 'supabase':
+                    _store = SupabaseSummaryStore(SUMMARY_CACHE_TTL_SECONDS, SUMMARY_CACHE_MAX_ENTRIES)
+                else:
+                    _store = SQLiteSummaryStore(
+                        SUMMARY_CACHE_PATH, SUMMARY_CACHE_TTL_SECONDS, SUMMARY_CACHE_MAX_ENTRIES
+                    )
+    return _store
+
+
+def get_summary(url, summary_type, prompt_version, model):
+    """Cached summary for these inputs, or None."""
+    try:
+        store = get_store()
+        if store is None:
+            return None
+        return store.get(cache_key(url, summary_type, prompt_version, model))
+    except Exception as e:
+        print(f"Error reading summary cache: {e}")
+        return None
+
+
+def save_summary(url, summary_type, prompt_version, model, summary):
+    """Store a generated summary under its inputs."""
+    try:
+        store = get_store()
+        if store is None:
+            return
+        store.put(
+            cache_key(url, summary_type, prompt_version, model), summary,
+            url=normalize_link(url), summary_type=summary_type,
+            prompt_version=str(prompt_version), model=model,
+        )
+    except Exception as e:
+        print(f"Error writing summary cache: {e}")
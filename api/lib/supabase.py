@@ -2,6 +2,7 @@
 
 import os
 import re
+from datetime import datetime, timezone
 from supabase import create_client, Client
 
 # Initialize Supabase client
@@ -93,6 +94,127 @@ def toggle_feed_active(feed_id: str, is_active: bool):
     return update_feed(feed_id, {'is_active': is_active})
 
 
+FEED_FETCH_STATE_FIELDS = (
+    'url,etag,last_modified,cached_entries,last_fetched_at,fetch_error,'
+    'publish_interval_seconds,unchanged_polls,consecutive_failures,next_poll_at'
+)
+
+
+def get_feed_fetch_state(url: str):
+    """Get the HTTP cache / fetch bookkeeping columns for a feed URL, or None."""
+    client = get_admin_client()
+    response = client.table('feeds').select(FEED_FETCH_STATE_FIELDS).eq('url', url).limit(1).execute()
+    return response.data[0] if response.data else None
+
+
+def get_feed_health_rows():
+    """Get every feed's fetch bookkeeping (without cached bodies) for the health view."""
+    client = get_admin_client()
+    response = client.table('feeds').select(
+        'id,name,url,is_active,last_fetched_at,fetch_error,consecutive_failures,unchanged_polls,next_poll_at'
+    ).order('name', desc=False).execute()
+    return response.data
+
+
+def update_feed_fetch_state(url: str, state: dict):
+    """Update fetch bookkeeping columns for a feed URL. No-op for URLs not in the table."""
+    client = get_admin_client()
+    response = client.table('feeds').update(state).eq('url', url).execute()
+    return response.data[0] if response.data else None
+
+
+# ============================================
+# Article Operations (ingestion store)
+# ============================================
+
+def upsert_articles(rows: list):
+    """Upsert ingested article rows keyed by link_key. Returns count written."""
+    client = get_admin_client()
+    synced = 0
+    for i in range(0, len(rows), 200):
+        batch = rows[i:i + 200]
+        response = client.table('articles').upsert(batch, on_conflict='link_key').execute()
+        synced += len(response.data)
+    return synced
+
+
+def get_article_link_keys_since(cutoff_iso: str):
+    """Get the link_key of every stored article published after cutoff."""
+    client = get_public_client()
+    keys = set()
+    page_size = 1000
+    offset = 0
+    while True:
+        response = client.table('articles').select('link_key').gt('published', cutoff_iso) \
+            .order('published', desc=True).range(offset, offset + page_size - 1).execute()
+        keys.update(r['link_key'] for r in response.data)
+        offset += page_size
+        if len(response.data) < page_size:
+            return keys
+
+
+def get_articles_since(cutoff_iso: str, sources: list = None):
+    """Get stored articles published after cutoff, newest first, optionally for some sources."""
+    client = get_public_client()
+    rows = []
+    page_size = 1000  # PostgREST caps each response; page through the range
+    while True:
+        query = client.table('articles').select('source,data').gt('published', cutoff_iso)
+        if sources:
+            query = query.in_('source', sources)
+        response = query.order('published', desc=True).range(len(rows), len(rows) + page_size - 1).execute()
+        rows.extend(response.data)
+        if len(response.data) < page_size:
+            return rows
+
+
+# ============================================
+# Summary Cache (api/lib/summary_cache.py)
+# ============================================
+
+def get_cached_summary(key: str):
+    """Get a cached summary row by its content key."""
+    client = get_admin_client()
+    response = client.table('summary_cache').select('summary,created_at,accessed_at') \
+        .eq('key', key).limit(1).execute()
+    return response.data[0] if response.data else None
+
+
+def save_cached_summary(row: dict):
+    """Insert or replace a cached summary row keyed by key."""
+    client = get_admin_client()
+    now = datetime.now(timezone.utc).isoformat()
+    response = client.table('summary_cache').upsert(
+        {**row, 'created_at': now, 'accessed_at': now}, on_conflict='key'
+    ).execute()
+    return response.data[0] if response.data else None
+
+
+def touch_cached_summary(key: str):
+    """Mark a cached summary as just read (LRU order)."""
+    client = get_admin_client()
+    client.table('summary_cache').update(
+        {'accessed_at': datetime.now(timezone.utc).isoformat()}
+    ).eq('key', key).execute()
+
+
+def delete_cached_summary(key: str):
+    client = get_admin_client()
+    client.table('summary_cache').delete().eq('key', key).execute()
+
+
+def evict_cached_summaries(expired_before_iso: str, max_entries: int):
+    """Delete summaries created before the TTL cutoff, then the least recently
+    read beyond max_entries."""
+    client = get_admin_client()
+    client.table('summary_cache').delete().lt('created_at', expired_before_iso).execute()
+    response = client.table('summary_cache').select('key').order('accessed_at', desc=True) \
+        .range(max_entries, max_entries + 999).execute()
+    keys = [r['key'] for r in response.data]
+    if keys:
+        client.table('summary_cache').delete().in_('key', keys).execute()
+
+
 # ============================================
 # Category Operations
 # ============================================
@@ -164,6 +286,7 @@ def create_icp_profile(profile_data: dict):
     if profile_data.get('is_default'):
         client.table('icp_profiles').update({'is_default': False}).eq('is_default', True).execute()
     response = client.table('icp_profiles').insert(profile_data).execute()
+    bump_icp_version()
     return response.data[0] if response.data else None
 
 
@@ -174,6 +297,7 @@ def update_icp_profile(profile_id: str, profile_data: dict):
     if profile_data.get('is_default'):
         client.table('icp_profiles').update({'is_default': False}).neq('id', profile_id).eq('is_default', True).execute()
     response = client.table('icp_profiles').update(profile_data).eq('id', profile_id).execute()
+    bump_icp_version()
     return response.data[0] if response.data else None
 
 
@@ -181,6 +305,7 @@ def delete_icp_profile(profile_id: str):
     """Delete an ICP profile."""
     client = get_admin_client()
     response = client.table('icp_profiles').delete().eq('id', profile_id).execute()
+    bump_icp_version()
     return response.data
 
 
@@ -191,9 +316,28 @@ def set_default_icp_profile(profile_id: str):
     client.table('icp_profiles').update({'is_default': False}).eq('is_default', True).execute()
     # Set new default
     response = client.table('icp_profiles').update({'is_default': True}).eq('id', profile_id).execute()
+    bump_icp_version()
     return response.data[0] if response.data else None
 
 
+# Stamp in admin_settings that changes on every ICP profile write, so
+# processes caching derived ICP data (api/shared.py) know to reload.
+ICP_VERSION_KEY = 'icp_version'
+
+
+def get_icp_version():
+    """Current ICP version stamp, or None if profiles have never been written."""
+    # admin_settings has no public read policy
+    client = get_admin_client()
+    response = client.table('admin_settings').select('value').eq('key', ICP_VERSION_KEY).execute()
+    return response.data[0]['value'] if response.data else None
+
+
+def bump_icp_version():
+    """Mark cached ICP data stale everywhere by writing a new version stamp."""
+    return update_setting(ICP_VERSION_KEY, datetime.now(timezone.utc).isoformat())
+
+
 # ============================================
 # Feed Suggestions (Discovery)
 # ============================================
@@ -241,6 +385,24 @@ def update_setting(key: str, value):
     return response.data[0] if response.data else None
 
 
+def get_settings(keys: list):
+    """Get several settings as a {key: value} dict (missing keys are left out)."""
+    client = get_admin_client()
+    response = client.table('admin_settings').select('key,value').in_('key', keys).execute()
+    return {item['key']: item['value'] for item in response.data}
+
+
+def get_settings_versions(keys: list):
+    """{key: updated_at} for the given settings rows, to detect edits cheaply.
+
+    Migration 007 keeps updated_at current on every update, including edits
+    made in the Supabase dashboard.
+    """
+    client = get_admin_client()
+    response = client.table('admin_settings').select('key,updated_at').in_('key', keys).execute()
+    return {item['key']: item['updated_at'] for item in response.data}
+
+
 def get_all_settings():
     """Get all settings as a dict."""
     client = get_public_client()
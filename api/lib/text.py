@@ -0,0 +1,138 @@
+"""Text normalization for feed entries.
+
+Feed summaries arrive as HTML fragments of every flavour. html_to_text()
+turns one into a single line of readable text: tags replaced by spaces (so
+paragraphs don't run together), entities unescaped, whitespace collapsed.
+key_bullets() then segments that text into sentences for the digest's key
+points. All patterns are compiled once at import, and work the regex engine
+would do per character (whitespace, sentence breaks) is done with str
+methods instead, which are several times faster on short summaries.
+
+The digest page renders summaries as HTML, so angle brackets that only
+appear after unescaping ("&lt;script&gt;") are kept escaped.
+"""
+
+import html
+import html.entities
+import re
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+# Entities common enough in feeds to replace with str.replace; text with any
+# other entity goes through html.unescape(), which runs a Python callback per
+# entity. '&amp;' is replaced last so '&amp;lt;' can't be unescaped twice.
+ENTITY_PATTERN = re.compile(r'&#?\w*;?')
+COMMON_ENTITIES = {
+    '&lt;': '<', '&gt;': '>', '&quot;': '"', '&#39;': "'", '&#039;': "'",
+    '&apos;': "'", '&nbsp;': '\xa0', '&#8217;': '\u2019', '&rsquo;': '\u2019',
+    '&#8216;': '\u2018', '&lsquo;': '\u2018', '&#8220;': '\u201c', '&ldquo;': '\u201c',
+    '&#8221;': '\u201d', '&rdquo;': '\u201d', '&#8211;': '\u2013', '&ndash;': '\u2013',
+    '&#8212;': '\u2014', '&mdash;': '\u2014', '&#8230;': '\u2026', '&hellip;': '\u2026',
+}
+# Sentence-ending punctuation followed by a space. html_to_text() output is
+# single-spaced, so these are exactly the breaks r'(?<=[.!?])\s+' finds, and
+# str.replace finds them without a regex scan of every character.
+SENTENCE_BREAKS = [(mark + ' ', mark + '\n') for mark in '.!?']
+
+SUMMARY_MAX_CHARS = 500
+# Markup read first per summary, as a fraction past the limit; the window
+# grows until it yields enough text. Full-text feeds put entire articles in
+# <description>, and normalizing (mostly the whitespace collapse) costs in
+# proportion to the markup read, yet only the start can reach the summary.
+SUMMARY_WINDOW_SLACK = 1.25
+# An entity cut in half at the window's end ('&CounterClockwiseContourInteg')
+# is the only text the cut can mangle, and it can't be longer than the longest
+# named reference. Text this far past the limit is cut away by truncate().
+SPLIT_ENTITY_CHARS = 1 + max(map(len, html.entities.html5))
+BULLET_COUNT = 3
+BULLET_MIN_CHARS = 20      # shorter fragments ("Read more.") aren't bullets
+BULLET_FALLBACK_CHARS = 200
+
+
+def html_to_text(markup):
+    """Plain, single-spaced text from an HTML fragment."""
+    if not markup:
+        return ''
+    text = markup
+    if '<' in text:
+        text = TAG_PATTERN.sub(' ', text)
+    if '&' in text:
+        # Collapsed to a space below like any whitespace, so skip the '\xa0'
+        text = text.replace('&nbsp;', ' ')
+    if '&' in text:
+        text = unescape(text)
+        if '<' in text or '>' in text:
+            text = text.replace('<', '&lt;').replace('>', '&gt;')
+    return collapse_whitespace(text)
+
+
+def collapse_whitespace(text):
+    """Runs of whitespace as single spaces, without leading or trailing space."""
+    # Every whitespace character but ' ' is non-printable, so stripped,
+    # printable text without doubled spaces is already collapsed and can be
+    # returned as is; str.split() allocates a string per word.
+    text = text.strip()
+    if '  ' not in text and text.isprintable():
+        return text
+    return ' '.join(text.split())
+
+
+def unescape(text):
+    """html.unescape(), with a fast path for text using only COMMON_ENTITIES."""
+    entities = set(ENTITY_PATTERN.findall(text))
+    has_amp = '&amp;' in entities
+    entities.discard('&amp;')
+    if not entities.issubset(COMMON_ENTITIES):
+        return html.unescape(text)
+    for entity in entities:
+        text = text.replace(entity, COMMON_ENTITIES[entity])
+    return text.replace('&amp;', '&') if has_amp else text
+
+
+def truncate(text, limit=SUMMARY_MAX_CHARS):
+    """Cut text to `limit` characters, marking the cut with '...'."""
+    if len(text) <= limit:
+        return text
+    return text[:limit].rstrip() + '...'
+
+
+def summary_text(markup, limit=SUMMARY_MAX_CHARS):
+    """The digest summary for an entry's HTML summary/description.
+
+    Same result as truncate(html_to_text(markup), limit), reading only as
+    much of the markup as it takes to fill the summary.
+    """
+    window = int(limit * SUMMARY_WINDOW_SLACK)
+    while markup and len(markup) > window:
+        head = markup[:window]
+        # Don't leave half a tag at the cut
+        open_tag = head.rfind('<')
+        if open_tag > head.rfind('>'):
+            head = head[:open_tag]
+        text = html_to_text(head)
+        if len(text) > limit + SPLIT_ENTITY_CHARS:
+            return truncate(text, limit)
+        # Scale the window by how much text it yielded, so tag-heavy markup
+        # is usually re-read once
+        window = int(window * SUMMARY_WINDOW_SLACK * limit / max(len(text), 1))
+    return truncate(html_to_text(markup), limit)
+
+
+def split_sentences(text):
+    """Split single-spaced text (html_to_text() output) after sentence-ending punctuation."""
+    text = text.strip()
+    for old, new in SENTENCE_BREAKS:
+        if old in text:
+            text = text.replace(old, new)
+    return text.split('\n')
+
+
+def key_bullets(text, count=BULLET_COUNT):
+    """The first `count` meaningful sentences of a summary (summary_text() output).
+
+    Falls back to the start of the text when no sentence is long enough.
+    """
+    if not text:
+        return []
+    sentences = [s for s in split_sentences(text) if len(s) > BULLET_MIN_CHARS]
+    return sentences[:count] if sentences else [text[:BULLET_FALLBACK_CHARS]]
@@ -1,8 +1,16 @@
 """Shared configuration and utilities for AI Digest serverless functions."""
 
+import os
 import re
+import threading
+import time
+from collections import Counter
 from datetime import datetime, timezone
-from dateutil import parser as date_parser
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from api.lib.dates import parse_date
+from api.lib.keyword_matcher import KeywordMatcher
+from api.lib.text import summary_text, key_bullets
 
 RSS_FEEDS = {
     "TechCrunch AI": {
@@ -331,9 +339,52 @@ SMB_KEYWORDS = [
 ]
 
 
-def parse_feed_entries(feed, name, config):
-    """Parse feed entries into article dicts."""
-    articles = []
+# Query params that only track the campaign or click, never select content.
+# Generic names like `source` or `ref` are left alone: some sites use them to
+# pick what the page shows, and stripping them would merge distinct articles.
+TRACKING_PARAMS = re.compile(r'^(utm_\w+|fbclid|gclid|mc_\w+)$')
+
+
+def normalize_link(url):
+    """Canonical form of an article URL, used as the dedupe / storage key.
+
+    Lowercases the scheme and host, drops "www.", tracking params, fragments
+    and trailing slashes.
+    """
+    parts = urlsplit(url.strip())
+    netloc = parts.netloc.lower()
+    if netloc.startswith('www.'):
+        netloc = netloc[4:]
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+             if not TRACKING_PARAMS.match(k.lower())]
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), netloc, path, urlencode(query), ''))
+
+
+# In a newest-first feed, a run of this many consecutive entries older than
+# the cutoff means the rest of the feed is older too. Only trusted while the
+# entry dates seen so far have never gone up (some feeds are oldest-first or
+# unordered, and their new entries can follow any number of old ones).
+STALE_RUN_LIMIT = 5
+
+
+def parse_feed_entries(feed, name, config, cutoff=None, seen=None):
+    """Parse feed entries into article dicts. See iter_feed_entries()."""
+    return list(iter_feed_entries(feed, name, config, cutoff, seen))
+
+
+def iter_feed_entries(feed, name, config, cutoff=None, seen=None):
+    """Lazily parse feed entries into article dicts.
+
+    Only the entry date is worked out up front. Entries without a parseable
+    date, published at or before `cutoff` (UTC-aware datetime), or whose id /
+    normalized link is in `seen` are skipped before any summary cleanup or
+    formatting. In a feed whose dates have only gone down so far, parsing
+    stops once STALE_RUN_LIMIT consecutive entries fall before the cutoff.
+    """
+    stale_run = 0
+    newest_first = True
+    prev_date = None
     for entry in feed.entries:
         pub_date = None
         # Path A: feedparser's _parsed fields are always UTC
@@ -345,23 +396,31 @@ def parse_feed_entries(feed, name, config):
                 except Exception:
                     pass
 
-        # Path B: parse date strings (dateutil may return aware or naive)
+        # Path B: parse date strings, in the format learned for this feed
         if not pub_date:
             for date_str_field in ['published', 'updated', 'created']:
-                if hasattr(entry, date_str_field) and getattr(entry, date_str_field):
-                    try:
-                        parsed = date_parser.parse(getattr(entry, date_str_field))
-                        # Normalize to UTC-aware
-                        if parsed.tzinfo is None:
-                            pub_date = parsed.replace(tzinfo=timezone.utc)
-                        else:
-                            pub_date = parsed.astimezone(timezone.utc)
-                        break
-                    except Exception:
-                        pass
+                pub_date = parse_date(entry.get(date_str_field), source=name)
+                if pub_date:
+                    break
 
+        # No usable date: skip rather than guess. Stamping it now() would put
+        # it in every digest window and keep it "new" on every fetch.
         if not pub_date:
-            pub_date = datetime.now(timezone.utc)
+            continue
+        if prev_date is not None and pub_date > prev_date:
+            newest_first = False
+        prev_date = pub_date
+
+        if cutoff is not None and pub_date <= cutoff:
+            stale_run += 1
+            if stale_run >= STALE_RUN_LIMIT and newest_first:
+                break
+            continue
+        stale_run = 0
+
+        link = entry.get('link', '')
+        if seen and (entry.get('id') in seen or normalize_link(link) in seen):
+            continue
 
         summary = ''
         if hasattr(entry, 'summary'):
@@ -369,50 +428,48 @@ def parse_feed_entries(feed, name, config):
         elif hasattr(entry, 'description'):
             summary = entry.description
 
-        summary = re.sub(r'<[^>]+>', '', summary)
-        if len(summary) > 500:
-            summary = summary[:500] + '...'
-
-        articles.append({
+        yield {
             'title': entry.get('title', 'No title'),
-            'link': entry.get('link', ''),
-            'summary': summary.strip(),
+            'link': link,
+            'summary': summary_text(summary),
             'published': pub_date.isoformat(),
             'published_display': pub_date.strftime('%b %d, %Y'),
             'source': name,
             'category': config['category'],
             'priority': config['priority'],
-        })
-    return articles
+        }
+
+
+# Topic rules, checked in order; the first list with a hit names the topic
+TOPIC_KEYWORDS = [
+    ('Funding & Deals', ['funding', 'raise', 'valuation', 'invest', 'investment', 'investor', 'billion', 'million']),
+    ('Product News', ['launch', 'release', 'announce', 'announcement', 'new feature', 'update']),
+    ('Research', ['research', 'study', 'paper', 'breakthrough']),
+    ('Policy & Regulation', ['regulation', 'law', 'policy', 'government', 'eu', 'congress']),
+    ('Big Tech', ['openai', 'anthropic', 'google', 'microsoft', 'meta', 'nvidia']),
+    ('SMB Focus', ['small business', 'smb', 'startup', 'entrepreneur']),
+]
 
 
-def is_ai_relevant(article):
-    text = (article['title'] + ' ' + article['summary']).lower()
-    return any(keyword in text for keyword in AI_KEYWORDS)
+def is_ai_relevant(article, hits=None):
+    hits = article_keyword_hits(article) if hits is None else hits
+    ai_keywords = keyword_counts('ai_keywords')
+    return any(keyword in ai_keywords for keyword in hits)
 
 
-def calculate_smb_score(article):
-    text = (article['title'] + ' ' + article['summary']).lower()
-    score = sum(1 for keyword in SMB_KEYWORDS if keyword in text)
+def calculate_smb_score(article, hits=None):
+    hits = article_keyword_hits(article) if hits is None else hits
+    smb_keywords = keyword_counts('smb_keywords')
+    score = sum(smb_keywords.get(keyword, 0) for keyword in hits)
     return min(score * 2, 10)
 
 
-def categorize_article(article):
-    text = (article['title'] + ' ' + article['summary']).lower()
-    if any(w in text for w in ['funding', 'raise', 'valuation', 'invest', 'billion', 'million']):
-        return 'Funding & Deals'
-    elif any(w in text for w in ['launch', 'release', 'announce', 'new feature', 'update']):
-        return 'Product News'
-    elif any(w in text for w in ['research', 'study', 'paper', 'breakthrough']):
-        return 'Research'
-    elif any(w in text for w in ['regulation', 'law', 'policy', 'government', 'eu', 'congress']):
-        return 'Policy & Regulation'
-    elif any(w in text for w in ['openai', 'anthropic', 'google', 'microsoft', 'meta', 'nvidia']):
-        return 'Big Tech'
-    elif any(w in text for w in ['small business', 'smb', 'startup', 'entrepreneur']):
-        return 'SMB Focus'
-    else:
-        return 'General AI News'
+def categorize_article(article, hits=None):
+    hits = article_keyword_hits(article) if hits is None else hits
+    for topic, keywords in TOPIC_KEYWORDS:
+        if not hits.isdisjoint(keywords):
+            return topic
+    return 'General AI News'
 
 
 VIRAL_KEYWORDS = [
@@ -513,89 +570,143 @@ ICP_PAIN_SIGNALS = [
 
 
 def extract_key_bullets(article):
-    """Extract 2-3 key bullet points from the article summary."""
-    summary = article.get('summary', '')
-    if not summary:
-        return []
+    """Extract 2-3 key bullet points from the article summary.
 
-    # Split on sentence boundaries
-    sentences = re.split(r'(?<=[.!?])\s+', summary.strip())
-    sentences = [s.strip() for s in sentences if len(s.strip()) > 20]
-
-    if len(sentences) <= 3:
-        return sentences if sentences else [summary[:200]]
-
-    # Return first 3 meaningful sentences
-    return sentences[:3]
+    The summary was already normalized at parse time (api/lib/text.py), so
+    this is just sentence segmentation.
+    """
+    return key_bullets(article.get('summary', ''))
 
 
-def calculate_viral_score(article):
+def calculate_viral_score(article, hits=None):
     """Score 0-10 for how viral/trending the topic is."""
-    text = (article['title'] + ' ' + article['summary']).lower()
-    score = sum(1 for kw in VIRAL_KEYWORDS if kw in text)
+    hits = article_keyword_hits(article) if hits is None else hits
+    viral_keywords = keyword_counts('viral_keywords')
+    score = sum(viral_keywords.get(kw, 0) for kw in hits)
     return min(score * 2, 10)
 
 
+# Derived ICP pain signals are cached per process. After ICP_CACHE_TTL_SECONDS
+# the cache re-checks the ICP version stamp in admin_settings (one small
+# query) and only reloads the profiles when an admin write has changed it.
+ICP_CACHE_TTL_SECONDS = 60
+
+_icp_cache = {'state': None, 'version': None, 'checked_at': 0.0}
+_icp_cache_lock = threading.Lock()
+
+
 def get_icp_pain_signals():
     """
     Get ICP pain signals, trying database first then falling back to hardcoded.
 
-    Returns list of dicts with 'keywords' and 'smb_impact' keys.
+    Returns list of dicts with 'keywords' and 'smb_impact' keys. In database
+    mode the result is cached; see ICP_CACHE_TTL_SECONDS.
+    """
+    return _icp_state()['signals']
+
+
+def get_icp_profile_signals():
+    """Pain signals for every active ICP profile: [(profile name, signals)].
+
+    Empty outside database mode. Cached alongside get_icp_pain_signals().
     """
-    import os
-    if os.environ.get('USE_DATABASE', 'false').lower() == 'true':
+    return _icp_state()['profiles']
+
+
+def _icp_state():
+    if os.environ.get('USE_DATABASE', 'false').lower() != 'true':
+        return {'signals': ICP_PAIN_SIGNALS, 'profiles': []}
+
+    with _icp_cache_lock:
+        now = time.monotonic()
+        cached = _icp_cache['state']
+        if cached is not None and now - _icp_cache['checked_at'] < ICP_CACHE_TTL_SECONDS:
+            return cached
+
+        version = _icp_cache['version']
         try:
+            from api.lib.supabase import get_icp_version
+            version = get_icp_version()
+        except Exception as e:
+            # Keep serving what we have; try again after the next TTL
+            print(f"Error checking ICP version: {e}")
+
+        if cached is None or version != _icp_cache['version']:
+            cached = _load_icp_state()
+        _icp_cache.update(state=cached, version=version, checked_at=now)
+        return cached
+
+
+def _load_icp_state():
+    """Load every active ICP profile's signal index.
+
+    The default profile's signals drive `impact`; hardcoded signals stand in
+    if it can't be loaded. A profile whose signals can't be derived is logged
+    and left out rather than failing enrichment for every feed. Also compiles
+    the enrichment matcher for all the signals here, so the first article
+    scored doesn't pay for it.
+    """
+    from api.lib.icp_signals import profile_signals
+
+    profiles = []
+    try:
+        from api.lib.supabase import get_active_icp_profiles
+        profiles = [p for p in get_active_icp_profiles() if p.get('data')]
+    except Exception as e:
+        print(f"Error loading ICP profiles from database: {e}")
+
+    signals = None
+    try:
+        default = next((p for p in profiles if p.get('is_default')), None)
+        if default is None:
             from api.lib.supabase import get_default_icp_profile
-            profile = get_default_icp_profile()
-            if profile and profile.get('data'):
-                data = profile['data']
-                signals = []
-
-                # Extract pain points and create impact signals
-                pain_points = data.get('pain_points', {}).get('top_pains', [])
-                keywords = data.get('language_patterns', {}).get('keywords_used', [])
-                audience = data.get('audience_overview', {}).get('primary_identity', 'your business')
-
-                # Generate dynamic signals from ICP data
-                for pain in pain_points[:5]:  # Top 5 pain points
-                    # Extract key terms from pain point
-                    pain_keywords = [w.lower() for w in pain.split() if len(w) > 4][:3]
-                    if pain_keywords:
-                        signals.append({
-                            'keywords': pain_keywords,
-                            'smb_impact': f"For {audience} dealing with {pain.lower()}, this development could offer relevant solutions or insights. Evaluate how it addresses this specific challenge in your business context.",
-                        })
-
-                # Add keyword-based signals
-                if keywords:
-                    signals.append({
-                        'keywords': [k.lower() for k in keywords[:10]],
-                        'smb_impact': f"This touches on topics relevant to {audience}. Consider how these developments apply to your specific industry context and operational needs.",
-                    })
-
-                if signals:
-                    return signals
+            default = get_default_icp_profile()
+        if default and default.get('data'):
+            signals = profile_signals(default)
+    except Exception as e:
+        print(f"Error loading ICP from database: {e}")
+
+    profile_list = []
+    for p in profiles:
+        try:
+            profile_list.append((p['name'], profile_signals(p)))
         except Exception as e:
-            print(f"Error loading ICP from database: {e}")
+            print(f"Skipping ICP profile {p.get('name') or p.get('id')!r}: {e}")
 
-    # Fall back to hardcoded signals
-    return ICP_PAIN_SIGNALS
+    state = {
+        # Fall back to hardcoded signals
+        'signals': signals or ICP_PAIN_SIGNALS,
+        'profiles': profile_list,
+    }
+    enrichment_matcher(all_icp_signals(state['signals'], state['profiles']))
+    return state
 
 
-def generate_impact(article):
-    """Generate 'What it Means' content based on article topic and ICP pain points."""
+def all_icp_signals(pain_signals, icp_profiles):
+    """The default signals plus every profile's, for building one matcher over all of them."""
+    return list(pain_signals) + [signal for _, signals in icp_profiles for signal in signals]
+
+
+def generate_impact(article, hits=None, pain_signals=None):
+    """Generate 'What it Means' content based on article topic and ICP pain points.
+
+    `pain_signals` defaults to get_icp_pain_signals(); `hits` must come from a
+    matcher that includes those signals' keywords (see enrichment_matcher()).
+    """
     topic = article.get('topic', 'General AI News')
     templates = IMPACT_TEMPLATES.get(topic, IMPACT_TEMPLATES['General AI News'])
     general = templates['general']
 
     # Get ICP pain signals (from database or hardcoded)
-    pain_signals = get_icp_pain_signals()
+    if pain_signals is None:
+        pain_signals = get_icp_pain_signals()
+    if hits is None:
+        hits = article_keyword_hits(article, enrichment_matcher(pain_signals))
 
     # Try to match article content to specific ICP pain points
-    text = (article['title'] + ' ' + article.get('summary', '')).lower()
     matched_impacts = []
     for signal in pain_signals:
-        if any(kw in text for kw in signal['keywords']):
+        if not hits.isdisjoint(signal['keywords']):
             matched_impacts.append(signal['smb_impact'])
 
     if matched_impacts:
@@ -611,7 +722,17 @@ def generate_impact(article):
     }
 
 
-def generate_viral_suggestions(article):
+# Trigger words for each kind of content suggestion in generate_viral_suggestions()
+SUGGESTION_KEYWORDS = {
+    'product': ['tool', 'app', 'product', 'launch', 'release'],
+    'jobs': ['jobs', 'layoffs', 'replace', 'automate'],
+    'policy': ['regulation', 'policy', 'law', 'ban', 'safety'],
+    'funding': ['funding', 'billion', 'valuation', 'invest', 'investment', 'investor'],
+    'research': ['breakthrough', 'research', 'paper', 'model'],
+}
+
+
+def generate_viral_suggestions(article, hits=None):
     """If article is viral, suggest content creation topics."""
     if article.get('viral_score', 0) < 4:
         return None
@@ -620,21 +741,21 @@ def generate_viral_suggestions(article):
     topic = article.get('topic', 'General AI News')
     base_topics = []
 
-    text = (title + ' ' + article.get('summary', '')).lower()
+    hits = article_keyword_hits(article) if hits is None else hits
 
-    if any(w in text for w in ['tool', 'app', 'product', 'launch', 'release']):
+    if not hits.isdisjoint(SUGGESTION_KEYWORDS['product']):
         base_topics.append(f"Review/comparison: How does this new tool stack up for small businesses?")
         base_topics.append(f"Tutorial: Getting started with the AI tool mentioned in '{title[:60]}'")
-    if any(w in text for w in ['jobs', 'layoffs', 'replace', 'automate']):
+    if not hits.isdisjoint(SUGGESTION_KEYWORDS['jobs']):
         base_topics.append("Opinion piece: What AI automation means for your industry's workforce")
         base_topics.append("Guide: How SMBs can use AI to augment (not replace) their teams")
-    if any(w in text for w in ['regulation', 'policy', 'law', 'ban', 'safety']):
+    if not hits.isdisjoint(SUGGESTION_KEYWORDS['policy']):
         base_topics.append("Explainer: What new AI regulations mean for small business owners")
         base_topics.append("Checklist: Is your business AI-compliant?")
-    if any(w in text for w in ['funding', 'billion', 'valuation', 'invest']):
+    if not hits.isdisjoint(SUGGESTION_KEYWORDS['funding']):
         base_topics.append("Analysis: What this funding round signals for the AI market")
         base_topics.append("Listicle: Affordable AI alternatives for budget-conscious businesses")
-    if any(w in text for w in ['breakthrough', 'research', 'paper', 'model']):
+    if not hits.isdisjoint(SUGGESTION_KEYWORDS['research']):
         base_topics.append(f"Simplified explainer: What this AI breakthrough means in plain English")
         base_topics.append("Prediction piece: How this research will affect everyday business tools")
 
@@ -645,14 +766,184 @@ def generate_viral_suggestions(article):
     return base_topics[:3]
 
 
-def enrich_articles(articles):
-    """Filter for AI relevance and add scores/topics."""
-    relevant = [a for a in articles if is_ai_relevant(a)]
-    for article in relevant:
-        article['smb_score'] = calculate_smb_score(article)
-        article['topic'] = categorize_article(article)
+def enrichment_keywords(pain_signals=(), lists=None):
+    """Every keyword the enrichment scorers look for, plus the given ICP signals'.
+
+    `lists` is the KeywordLists to read the AI / SMB / viral lists from
+    (default: the current ones).
+    """
+    lists = lists or keyword_lists()
+    keywords = set()
+    for words in lists.lists.values():
+        keywords.update(words)
+    for _, words in TOPIC_KEYWORDS:
+        keywords.update(words)
+    for words in SUGGESTION_KEYWORDS.values():
+        keywords.update(words)
+    for signal in pain_signals:
+        keywords.update(signal['keywords'])
+    return keywords
+
+
+# --- Admin-configurable keyword lists ---
+# In database mode the AI / SMB / viral lists come from admin_settings, so
+# curators can tune relevance without a deploy. The hardcoded lists above are
+# the defaults. Settings are re-checked at most every KEYWORD_CHECK_SECONDS,
+# by comparing the rows' updated_at (one small query), and changed lists are
+# swapped in as a new KeywordLists.
+DEFAULT_KEYWORDS = {
+    'ai_keywords': AI_KEYWORDS,
+    'smb_keywords': SMB_KEYWORDS,
+    'viral_keywords': VIRAL_KEYWORDS,
+}
+KEYWORD_SETTINGS = tuple(DEFAULT_KEYWORDS)
+KEYWORD_CHECK_SECONDS = 60
+
+
+class KeywordLists:
+    """One generation of the keyword lists: {setting key: [keywords]} plus
+    {setting key: {keyword: times listed}}.
+
+    Never mutated. apply_keyword_settings() replaces the current one whole,
+    so a reader holding it never sees a mix of old and new lists, and caches
+    keyed on it (the compiled matcher) can't pair stale lists with new ones.
+    """
+
+    def __init__(self, lists, generation):
+        self.lists = lists
+        self.counts = {key: dict(Counter(words)) for key, words in lists.items()}
+        self.generation = generation
+
+
+_keyword_state = {'lists': KeywordLists(DEFAULT_KEYWORDS, 0), 'version': None, 'checked_at': None}
+_keyword_lock = threading.Lock()
+
+
+def keyword_lists():
+    """The current KeywordLists."""
+    return _keyword_state['lists']
+
+
+def refresh_keyword_lists():
+    """Reload the keyword lists from admin_settings if they changed there.
+
+    Cheap to call per batch: outside database mode, or within
+    KEYWORD_CHECK_SECONDS of the last check, it does nothing.
+    """
+    if os.environ.get('USE_DATABASE', 'false').lower() != 'true':
+        return
+    with _keyword_lock:
+        now = time.monotonic()
+        checked_at = _keyword_state['checked_at']
+        if checked_at is not None and now - checked_at < KEYWORD_CHECK_SECONDS:
+            return
+        _keyword_state['checked_at'] = now
+        try:
+            from api.lib.supabase import get_settings_versions, get_settings
+            version = get_settings_versions(list(KEYWORD_SETTINGS))
+            if version == _keyword_state['version']:
+                return
+            apply_keyword_settings(get_settings(list(KEYWORD_SETTINGS)))
+            _keyword_state['version'] = version
+        except Exception as e:
+            print(f"Error loading keyword settings: {e}")
+
+
+def apply_keyword_settings(settings):
+    """Swap in keyword lists from a {setting key: [keywords]} dict.
+
+    Keys that are missing or not a non-empty list keep (or return to) their
+    defaults. Keywords are lowercased, since matching is case-insensitive.
+    The new lists are built first and replace the current KeywordLists in
+    one assignment, with the next generation. Returns True if any list
+    changed.
+    """
+    lists = {}
+    for key in KEYWORD_SETTINGS:
+        value = settings.get(key)
+        if isinstance(value, list) and value:
+            value = [str(w).lower() for w in value if str(w).strip()]
+        else:
+            value = DEFAULT_KEYWORDS[key]
+        lists[key] = value
+    current = _keyword_state['lists']
+    if lists == current.lists:
+        return False
+    # New generation: enrichment_matcher() compiles a fresh matcher
+    _keyword_state['lists'] = KeywordLists(lists, current.generation + 1)
+    return True
+
+
+def keyword_counts(key):
+    """{keyword: times listed} for a KEYWORD_SETTINGS list, current generation.
+
+    Lets scorers walk an article's few hits instead of a list that curators
+    may have grown to thousands of entries.
+    """
+    return _keyword_state['lists'].counts[key]
+
+
+@lru_cache(maxsize=8)
+def _compiled_matcher(signal_keywords, lists):
+    return KeywordMatcher(enrichment_keywords([{'keywords': signal_keywords}], lists))
+
+
+def enrichment_matcher(pain_signals=None, lists=None):
+    """Compiled matcher for all enrichment keyword lists plus the ICP pain signals.
+
+    Cached per distinct signal keyword set and KeywordLists (default: the
+    current ones), so it's built once per process unless the ICP profiles
+    or keyword settings change.
+    """
+    if pain_signals is None:
+        pain_signals = ICP_PAIN_SIGNALS
+    signal_keywords = tuple(sorted({kw for signal in pain_signals for kw in signal['keywords']}))
+    return _compiled_matcher(signal_keywords, lists or _keyword_state['lists'])
+
+
+def article_keyword_hits(article, matcher=None):
+    """Set of enrichment keywords occurring in an article's title + summary."""
+    matcher = matcher or enrichment_matcher()
+    return matcher.find(article['title'] + ' ' + article.get('summary', ''))
+
+
+def generate_icp_impacts(article, hits, icp_profiles):
+    """SMB impact for each ICP profile: {profile name: smb_impact}.
+
+    Same matching as generate_impact(), run against each profile's signals,
+    so one enrichment pass serves every audience's digest.
+    """
+    return {
+        name: generate_impact(article, hits, signals)['smb_impact']
+        for name, signals in icp_profiles
+    }
+
+
+def enrich_articles(articles, pain_signals=None, icp_profiles=None):
+    """Filter for AI relevance and add scores/topics.
+
+    ICP pain signals (the default profile's and every active profile's) are
+    loaded once per batch, unless given, and each article's text is scanned
+    once by one compiled matcher covering all of them; every scorer reads
+    that hit set.
+    """
+    refresh_keyword_lists()
+    if pain_signals is None:
+        pain_signals = get_icp_pain_signals()
+    if icp_profiles is None:
+        icp_profiles = get_icp_profile_signals()
+    matcher = enrichment_matcher(all_icp_signals(pain_signals, icp_profiles))
+    relevant = []
+    for article in articles:
+        hits = article_keyword_hits(article, matcher)
+        if not is_ai_relevant(article, hits):
+            continue
+        article['smb_score'] = calculate_smb_score(article, hits)
+        article['topic'] = categorize_article(article, hits)
         article['key_bullets'] = extract_key_bullets(article)
-        article['viral_score'] = calculate_viral_score(article)
-        article['impact'] = generate_impact(article)
-        article['content_suggestions'] = generate_viral_suggestions(article)
+        article['viral_score'] = calculate_viral_score(article, hits)
+        article['impact'] = generate_impact(article, hits, pain_signals)
+        article['icp_impacts'] = generate_icp_impacts(article, hits, icp_profiles)
+        article['content_suggestions'] = generate_viral_suggestions(article, hits)
+        relevant.append(article)
     return relevant
@@ -3,18 +3,45 @@
 Request body: {
     "url": "https://example.com/article",
     "type": "tldr" | "executive",
-    "title": "Article Title"
+    "title": "Article Title",
+    "stream": false
 }
 
-Response: { "success": true, "summary": "<html>", "error": null }
+Response: { "success": true, "summary": "<html>", "cached": false, "error": null }
+
+Generated summaries are cached by (normalized URL, type, prompt version,
+model) in api/lib/summary_cache.py; a hit skips the article fetch and the
+Claude call and comes back with "cached": true. Concurrent requests for the
+same uncached summary share one fetch + Claude call (api/lib/singleflight.py).
+
+With "stream": true the response is a Server-Sent Events stream instead, so
+the reader sees text at time-to-first-token rather than after the whole call:
+    data: {"type": "header", "html": "..."}      article title/source, at once
+    data: {"type": "delta", "text": "..."}       TL;DR: response text as it arrives
+    data: {"type": "section", "html": "..."}     executive: each section once complete
+    data: {"type": "done", "summary": "<html>", "cached": false}
+    data: {"type": "error", "error": "..."}
+"done" carries the finished summary, identical to the non-streamed one.
 """
 
 import json
 import os
 from http.server import BaseHTTPRequestHandler
 import anthropic
-import requests
 from bs4 import BeautifulSoup
+from api.lib.http_client import http_get
+from api.lib.summary_cache import cache_key, get_summary, save_summary
+from api.lib.singleflight import SingleFlight
+from api.lib.json_sections import SectionParser
+
+SUMMARY_MODEL = "claude-sonnet-4-5-20250929"
+
+# Bump a type's version whenever its prompt (or the rendering of its output)
+# changes, so summaries cached under the old prompt stop being served.
+PROMPT_VERSIONS = {'tldr': 1, 'executive': 1}
+
+# Summaries being generated right now, by cache key
+_in_flight = SingleFlight()
 
 
 def fetch_article_content(url):
@@ -23,10 +50,7 @@ def fetch_article_content(url):
     Returns dict with 'text' (article content) and 'metadata' (og:image, title).
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_get(url, timeout=10)
         response.raise_for_status()
 
         # Parse HTML
@@ -81,15 +105,9 @@ def strip_code_fences(text):
     return text.strip()
 
 
-def generate_tldr_summary(article_text, title, url):
-    """Generate a TL;DR summary using Claude."""
-    api_key = os.environ.get('ANTHROPIC_API_KEY')
-    if not api_key:
-        raise Exception("ANTHROPIC_API_KEY not configured")
-
-    client = anthropic.Anthropic(api_key=api_key)
-
-    prompt = f"""Generate a concise TL;DR summary of this article in HTML format.
+def tldr_prompt(article_text, title, url):
+    """The TL;DR prompt for an article."""
+    return f"""Generate a concise TL;DR summary of this article in HTML format.
 
 Article Title: {title}
 Article URL: {url}
@@ -110,26 +128,10 @@ Format your response as clean HTML with:
 IMPORTANT: Return ONLY raw HTML. Do NOT wrap your response in markdown code fences (```). Do not include the article title (it's already shown above your summary).
 """
 
-    message = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=1024,
-        messages=[
-            {"role": "user", "content": prompt}
-        ]
-    )
 
-    return strip_code_fences(message.content[0].text)
-
-
-def generate_executive_summary(article_text, title, url):
-    """Generate a structured executive summary as JSON, then render to inline HTML."""
-    api_key = os.environ.get('ANTHROPIC_API_KEY')
-    if not api_key:
-        raise Exception("ANTHROPIC_API_KEY not configured")
-
-    client = anthropic.Anthropic(api_key=api_key)
-
-    prompt = f"""When processing source material, extract and organize all content following these specifications:
+def executive_prompt(article_text, title, url):
+    """The executive-summary prompt for an article (asks for JSON)."""
+    return f"""When processing source material, extract and organize all content following these specifications:
 
 1. Initial Content Extraction
 - Capture every piece of information from the source exactly as presented
@@ -234,15 +236,28 @@ Example JSON:
 IMPORTANT: Return ONLY valid JSON. Do NOT wrap in markdown code fences.
 """
 
-    message = client.messages.create(
-        model="claude-sonnet-4-5-20250929",
-        max_tokens=2048,
-        messages=[
-            {"role": "user", "content": prompt}
-        ]
-    )
 
-    raw = strip_code_fences(message.content[0].text)
+SUMMARY_PROMPTS = {'tldr': tldr_prompt, 'executive': executive_prompt}
+MAX_TOKENS = {'tldr': 1024, 'executive': 2048}
+
+
+def summary_request(summary_type, article_text, title, url):
+    """Messages API parameters for one summary; also the body of a batch request."""
+    return {
+        'model': SUMMARY_MODEL,
+        'max_tokens': MAX_TOKENS[summary_type],
+        'messages': [
+            {"role": "user", "content": SUMMARY_PROMPTS[summary_type](article_text, title, url)}
+        ],
+    }
+
+
+def render_summary(summary_type, text):
+    """Summary HTML from Claude's response text for a summary type."""
+    if summary_type == 'tldr':
+        return strip_code_fences(text)
+
+    raw = strip_code_fences(text)
     try:
         summary_json = json.loads(raw)
     except json.JSONDecodeError:
@@ -255,37 +270,66 @@ IMPORTANT: Return ONLY valid JSON. Do NOT wrap in markdown code fences.
     return render_executive_html(summary_json)
 
 
+def anthropic_client():
+    api_key = os.environ.get('ANTHROPIC_API_KEY')
+    if not api_key:
+        raise Exception("ANTHROPIC_API_KEY not configured")
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def generate_summary(summary_type, article_text, title, url):
+    """Generate a summary of the given type with one Claude call."""
+    message = anthropic_client().messages.create(**summary_request(summary_type, article_text, title, url))
+    return render_summary(summary_type, message.content[0].text)
+
+
+def generate_tldr_summary(article_text, title, url):
+    """Generate a TL;DR summary using Claude."""
+    return generate_summary('tldr', article_text, title, url)
+
+
+def generate_executive_summary(article_text, title, url):
+    """Generate a structured executive summary as JSON, then render to inline HTML."""
+    return generate_summary('executive', article_text, title, url)
+
+
 def render_executive_html(data):
     """Render executive summary JSON into inline HTML for the modal."""
-    from html import escape
+    html = render_executive_subtitle(data)
+    for section in data.get('sections', []):
+        html += render_executive_section(section)
+    return html
 
-    html = ''
 
-    # Subtitle
+def render_executive_subtitle(data):
     if data.get('subtitle'):
-        html += f'<p style="color: #555; font-style: italic; margin-bottom: 16px;">{data["subtitle"]}</p>'
+        return f'<p style="color: #555; font-style: italic; margin-bottom: 16px;">{data["subtitle"]}</p>'
+    return ''
 
-    for section in data.get('sections', []):
-        heading = escape(section.get('heading', ''))
-        html += f'<h4 style="color: #667eea; margin: 20px 0 8px;">{heading}</h4>'
-
-        if section.get('body'):
-            html += f'<p style="margin-bottom: 12px;">{section["body"]}</p>'
-
-        if section.get('items'):
-            html += '<ul style="padding-left: 20px; margin: 8px 0 12px;">'
-            for item in section['items']:
-                topic = escape(item.get('topic', ''))
-                details = escape(item.get('details', ''))
-                html += f'<li style="margin-bottom: 6px;"><strong>{topic}:</strong> {details}</li>'
-            html += '</ul>'
-
-        if section.get('entities'):
-            for entity in section['entities']:
-                etype = escape(entity.get('type', ''))
-                ename = escape(entity.get('name', ''))
-                erelation = escape(entity.get('relation', ''))
-                html += f'''<div style="padding: 8px 0; border-bottom: 1px solid #f0f0f0;">
+
+def render_executive_section(section):
+    from html import escape
+
+    heading = escape(section.get('heading', ''))
+    html = f'<h4 style="color: #667eea; margin: 20px 0 8px;">{heading}</h4>'
+
+    if section.get('body'):
+        html += f'<p style="margin-bottom: 12px;">{section["body"]}</p>'
+
+    if section.get('items'):
+        html += '<ul style="padding-left: 20px; margin: 8px 0 12px;">'
+        for item in section['items']:
+            topic = escape(item.get('topic', ''))
+            details = escape(item.get('details', ''))
+            html += f'<li style="margin-bottom: 6px;"><strong>{topic}:</strong> {details}</li>'
+        html += '</ul>'
+
+    if section.get('entities'):
+        for entity in section['entities']:
+            etype = escape(entity.get('type', ''))
+            ename = escape(entity.get('name', ''))
+            erelation = escape(entity.get('relation', ''))
+            html += f'''<div style="padding: 8px 0; border-bottom: 1px solid #f0f0f0;">
                     <span style="font-size: 0.7rem; text-transform: uppercase; color: #667eea; font-weight: 600;">{etype}</span>
                     <div style="font-weight: 600;">{ename}</div>
                     <div style="color: #555; font-size: 0.9rem;">{erelation}</div>
@@ -294,17 +338,110 @@ def render_executive_html(data):
     return html
 
 
+def stream_summary(summary_type, article_text, title, url, emit):
+    """Generate a summary with a streamed Claude call, passing progress to emit().
+
+    TL;DR text is forwarded as it arrives ({"type": "delta", "text"}); the
+    executive JSON is parsed incrementally and each section is sent rendered
+    as soon as it is complete ({"type": "section", "html"}). Returns the
+    finished summary HTML, the same as generate_summary().
+    """
+    parser = SectionParser() if summary_type == 'executive' else None
+    parts = []
+    with anthropic_client().messages.stream(**summary_request(summary_type, article_text, title, url)) as stream:
+        for text in stream.text_stream:
+            parts.append(text)
+            if parser is None:
+                emit({'type': 'delta', 'text': text})
+                continue
+            for kind, value in parser.feed(text):
+                html = render_executive_subtitle(value) if kind == 'head' else render_executive_section(value)
+                if html:
+                    emit({'type': 'section', 'html': html})
+    return render_summary(summary_type, ''.join(parts))
+
+
+def summarize_article(url, summary_type, title, emit=None):
+    """Summary body for an article: cached, shared with a concurrent request
+    for the same summary, or generated (and cached) here.
+
+    With `emit`, a summary generated here is streamed (see stream_summary());
+    cached and shared summaries arrive whole.
+
+    Returns (summary, cached); cached is False only for the request whose
+    fetch + Claude call produced the summary.
+    """
+    prompt_version = PROMPT_VERSIONS[summary_type]
+    summary = get_summary(url, summary_type, prompt_version, SUMMARY_MODEL)
+    if summary is not None:
+        return summary, True
+
+    def generate():
+        # A flight that finished after our cache check has already stored it
+        summary = get_summary(url, summary_type, prompt_version, SUMMARY_MODEL)
+        if summary is not None:
+            return summary, True
+
+        # Fetch article content
+        result = fetch_article_content(url)
+        article_text = result['text']
+
+        if not article_text:
+            raise Exception("No content could be extracted from the article")
+
+        # Generate summary based on type
+        if emit is not None:
+            summary = stream_summary(summary_type, article_text, title, url, emit)
+        elif summary_type == 'tldr':
+            summary = generate_tldr_summary(article_text, title, url)
+        else:
+            summary = generate_executive_summary(article_text, title, url)
+        save_summary(url, summary_type, prompt_version, SUMMARY_MODEL, summary)
+        return summary, False
+
+    key = cache_key(url, summary_type, prompt_version, SUMMARY_MODEL)
+    (summary, cached), shared = _in_flight.do(key, generate)
+    return summary, cached or shared
+
+
+def summary_header(title, source, date):
+    """Article metadata shown above a summary."""
+    from html import escape
+    header = f'<h3 style="margin: 0 0 4px 0; font-size: 1.05rem; color: #333;">{escape(title)}</h3>'
+    meta_parts = []
+    if source:
+        meta_parts.append(f'<span style="font-weight: 600; color: #667eea;">{escape(source)}</span>')
+    if date:
+        meta_parts.append(f'<span>{escape(date)}</span>')
+    if meta_parts:
+        header += f'<p style="font-size: 0.8rem; color: #888; margin: 0 0 16px 0;">{" &middot; ".join(meta_parts)}</p>'
+    header += '<hr style="border: none; border-top: 1px solid #e9ecef; margin: 0 0 16px 0;">'
+    return header
+
+
+def summary_footer(url):
+    return f'''
+                <p style="margin-top: 20px; padding-top: 16px; border-top: 1px solid #e9ecef; font-size: 0.85rem;">
+                    <a href="{url}" target="_blank" style="color: #667eea; text-decoration: none;">Read full article →</a>
+                </p>
+            '''
+
+
 class handler(BaseHTTPRequestHandler):
     def do_POST(self):
         content_length = int(self.headers.get('Content-Length', 0))
         body = json.loads(self.rfile.read(content_length)) if content_length else {}
 
         url = body.get('url', '')
-        summary_type = body.get('type', 'tldr')
+        summary_type = 'tldr' if body.get('type', 'tldr') == 'tldr' else 'executive'
         title = body.get('title', 'Article')
         source = body.get('source', '')
         date = body.get('date', '')
 
+        if url and body.get('stream'):
+            self.stream_response(url, summary_type, title, summary_header(title, source, date))
+            return
+
         self.send_response(200)
         self.send_header('Content-Type', 'application/json')
         self.send_header('Access-Control-Allow-Origin', '*')
@@ -319,42 +456,13 @@ class handler(BaseHTTPRequestHandler):
             return
 
         try:
-            # Fetch article content
-            result = fetch_article_content(url)
-            article_text = result['text']
-
-            if not article_text:
-                raise Exception("No content could be extracted from the article")
-
-            # Generate summary based on type
-            if summary_type == 'tldr':
-                summary = generate_tldr_summary(article_text, title, url)
-            else:
-                summary = generate_executive_summary(article_text, title, url)
-
-            # Build article metadata header
-            from html import escape
-            header = f'<h3 style="margin: 0 0 4px 0; font-size: 1.05rem; color: #333;">{escape(title)}</h3>'
-            meta_parts = []
-            if source:
-                meta_parts.append(f'<span style="font-weight: 600; color: #667eea;">{escape(source)}</span>')
-            if date:
-                meta_parts.append(f'<span>{escape(date)}</span>')
-            if meta_parts:
-                header += f'<p style="font-size: 0.8rem; color: #888; margin: 0 0 16px 0;">{" &middot; ".join(meta_parts)}</p>'
-            header += '<hr style="border: none; border-top: 1px solid #e9ecef; margin: 0 0 16px 0;">'
-
-            footer = f'''
-                <p style="margin-top: 20px; padding-top: 16px; border-top: 1px solid #e9ecef; font-size: 0.85rem;">
-                    <a href="{url}" target="_blank" style="color: #667eea; text-decoration: none;">Read full article →</a>
-                </p>
-            '''
-
-            summary = header + summary + footer
+            summary, cached = summarize_article(url, summary_type, title)
+            summary = summary_header(title, source, date) + summary + summary_footer(url)
 
             self.wfile.write(json.dumps({
                 'success': True,
                 'summary': summary,
+                'cached': cached,
                 'error': None
             }).encode())
 
@@ -365,6 +473,37 @@ class handler(BaseHTTPRequestHandler):
                 'error': str(e)
             }).encode())
 
+    def stream_response(self, url, summary_type, title, header):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('X-Accel-Buffering', 'no')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+
+        self.client_gone = False
+        self.send_event({'type': 'header', 'html': header})
+        try:
+            summary, cached = summarize_article(url, summary_type, title, emit=self.send_event)
+            self.send_event({
+                'type': 'done',
+                'summary': header + summary + summary_footer(url),
+                'cached': cached,
+            })
+        except Exception as e:
+            self.send_event({'type': 'error', 'error': str(e)})
+
+    def send_event(self, event):
+        """Write one SSE event. A reader who closed the modal doesn't stop the
+        generation: it still finishes and is cached for the next click."""
+        if self.client_gone:
+            return
+        try:
+            self.wfile.write(b'data: ' + json.dumps(event).encode() + b'\n\n')
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            self.client_gone = True
+
     def do_OPTIONS(self):
         self.send_response(200)
         self.send_header('Access-Control-Allow-Origin', '*')
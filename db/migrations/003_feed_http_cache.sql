@@ -0,0 +1,14 @@
+-- ============================================
+-- Migration 003 — Feed HTTP cache (conditional GET)
+--
+-- Extends feeds.last_fetched_at into a real per-feed cache: the HTTP
+-- validators from the last 200 response plus the entries parsed from it.
+-- Fetches send If-None-Match / If-Modified-Since; a 304 reuses
+-- cached_entries instead of re-downloading and re-parsing the feed.
+--
+-- Purely additive. Re-runnable. Also reflected in db/schema.sql.
+-- ============================================
+
+ALTER TABLE feeds ADD COLUMN IF NOT EXISTS etag TEXT;
+ALTER TABLE feeds ADD COLUMN IF NOT EXISTS last_modified TEXT;          -- raw Last-Modified header, echoed back verbatim
+ALTER TABLE feeds ADD COLUMN IF NOT EXISTS cached_entries JSONB;        -- parse_feed_entries() output for the cached body
@@ -0,0 +1,39 @@
+-- ============================================
+-- Migration 004 — Persisted articles (background ingestion)
+--
+-- The ingestion worker (scripts/ingest_feeds.py, /api/ingest cron) polls the
+-- feeds table, enriches new entries and upserts them here, keyed by
+-- normalized link (api.shared.normalize_link). Digest generation then reads
+-- one indexed range of this table instead of fetching every feed live.
+--
+-- Purely additive. Re-runnable. Also reflected in db/schema.sql.
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS articles (
+  id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+  link_key TEXT NOT NULL UNIQUE,            -- normalize_link(link)
+  link TEXT NOT NULL,
+  source TEXT NOT NULL,                     -- feed name
+  published TIMESTAMPTZ NOT NULL,
+  priority INTEGER,
+  topic TEXT,
+  smb_score INTEGER,
+  viral_score INTEGER,
+  data JSONB NOT NULL,                      -- full enriched article as served to the digest page
+  ingested_at TIMESTAMPTZ DEFAULT now(),
+  updated_at TIMESTAMPTZ DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published DESC);
+CREATE INDEX IF NOT EXISTS idx_articles_source_published ON articles(source, published DESC);
+
+ALTER TABLE articles ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Public read access for articles" ON articles;
+CREATE POLICY "Public read access for articles" ON articles
+  FOR SELECT USING (true);
+
+DROP TRIGGER IF EXISTS articles_updated_at ON articles;
+CREATE TRIGGER articles_updated_at
+  BEFORE UPDATE ON articles
+  FOR EACH ROW EXECUTE FUNCTION update_updated_at();
@@ -0,0 +1,16 @@
+-- ============================================
+-- Migration 005 — Adaptive feed polling schedule
+--
+-- The ingestion worker learns each feed's publish interval from the entry
+-- timestamps it parses and schedules the next poll from it, backing off on
+-- unchanged (304) and failed polls. See api/lib/poll_schedule.py.
+--
+-- Purely additive. Re-runnable. Also reflected in db/schema.sql.
+-- ============================================
+
+ALTER TABLE feeds ADD COLUMN IF NOT EXISTS publish_interval_seconds INTEGER;  -- learned median gap between entries
+ALTER TABLE feeds ADD COLUMN IF NOT EXISTS unchanged_polls INTEGER DEFAULT 0; -- consecutive polls with nothing new
+ALTER TABLE feeds ADD COLUMN IF NOT EXISTS consecutive_failures INTEGER DEFAULT 0;
+ALTER TABLE feeds ADD COLUMN IF NOT EXISTS next_poll_at TIMESTAMPTZ;
+
+CREATE INDEX IF NOT EXISTS idx_feeds_next_poll ON feeds(next_poll_at) WHERE is_active = true;
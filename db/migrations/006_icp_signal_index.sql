@@ -0,0 +1,13 @@
+-- ============================================
+-- Migration 006 — Precomputed ICP signal index
+--
+-- The pain signals enrichment matches articles against are derived from an
+-- ICP profile's data when the profile is saved (api/admin/icps.py) and
+-- stored here, so digests load them ready to use. Rows saved before this
+-- migration have no index; it is derived on load until they are next saved.
+-- See api/lib/icp_signals.py.
+--
+-- Purely additive. Re-runnable. Also reflected in db/schema.sql.
+-- ============================================
+
+ALTER TABLE icp_profiles ADD COLUMN IF NOT EXISTS signal_index JSONB;  -- {version, signals: [{keywords, smb_impact}]}
@@ -0,0 +1,15 @@
+-- ============================================
+-- Migration 007 — Track admin_settings edits
+--
+-- Enrichment loads ai_keywords / smb_keywords / viral_keywords from
+-- admin_settings and reloads them when a row's updated_at changes (see
+-- refresh_keyword_lists() in api/shared.py). Keep updated_at current on
+-- every update, including edits made directly in the Supabase dashboard.
+--
+-- Purely additive. Re-runnable. Also reflected in db/schema.sql.
+-- ============================================
+
+DROP TRIGGER IF EXISTS admin_settings_updated_at ON admin_settings;
+CREATE TRIGGER admin_settings_updated_at
+  BEFORE UPDATE ON admin_settings
+  FOR EACH ROW EXECUTE FUNCTION update_updated_at();
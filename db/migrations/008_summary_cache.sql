@@ -0,0 +1,30 @@
+-- ============================================
+-- Migration 008 — Summary cache
+--
+-- /api/summarize caches generated TL;DR and executive summaries keyed by a
+-- hash of (normalized URL, summary type, prompt version, model), so repeat
+-- requests skip the article scrape and the Claude call. Used when
+-- SUMMARY_CACHE=supabase (see api/lib/summary_cache.py); entries expire by
+-- created_at and the least recently read (accessed_at) are evicted past the
+-- size bound.
+--
+-- Service-key access only: RLS is enabled with no public policy.
+--
+-- Purely additive. Re-runnable. Also reflected in db/schema.sql.
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS summary_cache (
+  key TEXT PRIMARY KEY,                     -- sha256 of the inputs above
+  url TEXT,                                 -- normalize_link(url)
+  summary_type TEXT,
+  prompt_version TEXT,
+  model TEXT,
+  summary TEXT NOT NULL,
+  created_at TIMESTAMPTZ DEFAULT now(),
+  accessed_at TIMESTAMPTZ DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_summary_cache_accessed ON summary_cache(accessed_at DESC);
+CREATE INDEX IF NOT EXISTS idx_summary_cache_created ON summary_cache(created_at);
+
+ALTER TABLE summary_cache ENABLE ROW LEVEL SECURITY;
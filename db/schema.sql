@@ -41,6 +41,15 @@ CREATE TABLE feeds (
   description TEXT,
   last_fetched_at TIMESTAMPTZ,
   fetch_error TEXT,
+  -- HTTP cache for conditional GET (migration 003)
+  etag TEXT,
+  last_modified TEXT,
+  cached_entries JSONB,
+  -- Adaptive polling schedule (migration 005)
+  publish_interval_seconds INTEGER,
+  unchanged_polls INTEGER DEFAULT 0,
+  consecutive_failures INTEGER DEFAULT 0,
+  next_poll_at TIMESTAMPTZ,
   created_at TIMESTAMPTZ DEFAULT now(),
   updated_at TIMESTAMPTZ DEFAULT now()
 );
@@ -48,6 +57,7 @@ CREATE TABLE feeds (
 -- Index for active feeds lookup
 CREATE INDEX idx_feeds_active ON feeds(is_active) WHERE is_active = true;
 CREATE INDEX idx_feeds_category ON feeds(category);
+CREATE INDEX idx_feeds_next_poll ON feeds(next_poll_at) WHERE is_active = true;
 
 -- ============================================
 -- ICP PROFILES TABLE
@@ -61,6 +71,8 @@ CREATE TABLE icp_profiles (
   -- Quick access fields extracted from data
   pain_points TEXT[] DEFAULT '{}',
   keywords TEXT[] DEFAULT '{}',
+  -- Pain signals derived from data at save time (migration 006, api/lib/icp_signals.py)
+  signal_index JSONB,
   -- Source tracking
   source_type TEXT DEFAULT 'json' CHECK (source_type IN ('json', 'text', 'insight360')),
   insight360_id UUID, -- Reference to Insight360 ICP if applicable
@@ -107,6 +119,44 @@ CREATE TABLE digest_history (
   markdown_export TEXT
 );
 
+-- ============================================
+-- ARTICLES (background ingestion, migration 004)
+-- ============================================
+CREATE TABLE articles (
+  id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+  link_key TEXT NOT NULL UNIQUE, -- normalize_link(link)
+  link TEXT NOT NULL,
+  source TEXT NOT NULL,
+  published TIMESTAMPTZ NOT NULL,
+  priority INTEGER,
+  topic TEXT,
+  smb_score INTEGER,
+  viral_score INTEGER,
+  data JSONB NOT NULL, -- full enriched article as served to the digest page
+  ingested_at TIMESTAMPTZ DEFAULT now(),
+  updated_at TIMESTAMPTZ DEFAULT now()
+);
+
+CREATE INDEX idx_articles_published ON articles(published DESC);
+CREATE INDEX idx_articles_source_published ON articles(source, published DESC);
+
+-- ============================================
+-- SUMMARY CACHE (generated summaries, migration 008)
+-- ============================================
+CREATE TABLE summary_cache (
+  key TEXT PRIMARY KEY, -- sha256 of (normalized url, type, prompt version, model)
+  url TEXT,
+  summary_type TEXT,
+  prompt_version TEXT,
+  model TEXT,
+  summary TEXT NOT NULL,
+  created_at TIMESTAMPTZ DEFAULT now(),
+  accessed_at TIMESTAMPTZ DEFAULT now()
+);
+
+CREATE INDEX idx_summary_cache_accessed ON summary_cache(accessed_at DESC);
+CREATE INDEX idx_summary_cache_created ON summary_cache(created_at);
+
 -- ============================================
 -- ADMIN SETTINGS
 -- ============================================
@@ -135,6 +185,8 @@ ALTER TABLE icp_profiles ENABLE ROW LEVEL SECURITY;
 ALTER TABLE feed_suggestions ENABLE ROW LEVEL SECURITY;
 ALTER TABLE digest_history ENABLE ROW LEVEL SECURITY;
 ALTER TABLE admin_settings ENABLE ROW LEVEL SECURITY;
+ALTER TABLE articles ENABLE ROW LEVEL SECURITY;
+ALTER TABLE summary_cache ENABLE ROW LEVEL SECURITY; -- service key only, no policies
 
 -- Public read access for feeds (needed for digest generation)
 CREATE POLICY "Public read access for active feeds" ON feeds
@@ -152,6 +204,10 @@ CREATE POLICY "Public read access for active ICPs" ON icp_profiles
 CREATE POLICY "Public read access for feed suggestions" ON feed_suggestions
   FOR SELECT USING (true);
 
+-- Public read access for ingested articles
+CREATE POLICY "Public read access for articles" ON articles
+  FOR SELECT USING (true);
+
 -- Admin full access (authenticated users)
 CREATE POLICY "Admin full access to feeds" ON feeds
   FOR ALL USING (auth.role() = 'authenticated');
@@ -197,6 +253,14 @@ CREATE TRIGGER icp_profiles_updated_at
   BEFORE UPDATE ON icp_profiles
   FOR EACH ROW EXECUTE FUNCTION update_updated_at();
 
+CREATE TRIGGER articles_updated_at
+  BEFORE UPDATE ON articles
+  FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
+CREATE TRIGGER admin_settings_updated_at
+  BEFORE UPDATE ON admin_settings
+  FOR EACH ROW EXECUTE FUNCTION update_updated_at();
+
 -- Function to extract pain points and keywords from ICP data
 CREATE OR REPLACE FUNCTION extract_icp_fields()
 RETURNS TRIGGER AS $$
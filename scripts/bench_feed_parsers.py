@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+bench_feed_parsers.py — Compare the incremental feed parser against feedparser.
+
+For each feed body, runs both backends (api.lib.stream_feed_parser and
+feedparser) through parse_feed_entries() and reports best-of-N wall time and
+peak Python heap (tracemalloc), plus whether both produce identical articles.
+
+USAGE
+    python3 scripts/bench_feed_parsers.py path/to/feeds/ one-feed.xml
+    python3 scripts/bench_feed_parsers.py scripts/feed-corpus/     # committed real feeds
+    python3 scripts/bench_feed_parsers.py --synthetic 1000 --synthetic 10000
+    python3 scripts/bench_feed_parsers.py --synthetic 1000 --json results.json
+
+With no paths and no --synthetic, benchmarks synthetic 100- and 1000-entry feeds.
+The small hand-written feeds in scripts/parser-fixtures/ (namespaced
+elements, Atom xhtml content, ...) are always included as parity cases.
+Exits non-zero if the two backends disagree on any feed.
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from feed_fixtures import load_fixture_bodies, synthetic_feed
+
+import feedparser  # noqa: E402
+from api.lib import stream_feed_parser  # noqa: E402
+from api.shared import parse_feed_entries  # noqa: E402
+
+CONFIG = {'category': 'Benchmark', 'priority': 2}
+
+PARITY_DIR = Path(__file__).resolve().parent / 'parser-fixtures'
+
+BACKENDS = {
+    'feedparser': feedparser.parse,
+    'stream': stream_feed_parser.parse,
+}
+
+
+def run_backend(parse, body):
+    feed = parse(body)
+    if feed is None:
+        return None
+    return parse_feed_entries(feed, 'bench', CONFIG)
+
+
+def measure(parse, body, repeat):
+    best = float('inf')
+    articles = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        articles = run_backend(parse, body)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    run_backend(parse, body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, articles
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark feed parser backends.")
+    parser.add_argument('paths', nargs='*', help="Feed body files or directories of .xml files")
+    parser.add_argument('--synthetic', type=int, action='append', metavar='N',
+                        help="Add a synthetic RSS feed with N entries (repeatable)")
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per backend (best is kept)")
+    parser.add_argument('--json', metavar='FILE', help="Also write results as JSON")
+    args = parser.parse_args()
+
+    bodies = load_fixture_bodies(args.paths)
+    sizes = args.synthetic or ([] if bodies else [100, 1000])
+    bodies += [(f'synthetic-{n}', synthetic_feed(n)) for n in sizes]
+    bodies += load_fixture_bodies([PARITY_DIR])
+
+    results = []
+    print(f"{'feed':<40} {'KB':>8} {'entries':>7}  {'feedparser ms':>13} {'stream ms':>10}  "
+          f"{'fp peak KB':>10} {'st peak KB':>10}  match")
+    for name, body in bodies:
+        row = {'feed': name, 'bytes': len(body)}
+        outputs = {}
+        for backend, parse in BACKENDS.items():
+            seconds, peak, articles = measure(parse, body, args.repeat)
+            outputs[backend] = articles
+            row[backend] = {
+                'seconds': seconds,
+                'peak_bytes': peak,
+                'entries': len(articles) if articles is not None else None,
+            }
+        row['identical'] = outputs['stream'] is not None and outputs['stream'] == outputs['feedparser']
+        results.append(row)
+
+        fp, st = row['feedparser'], row['stream']
+        st_ms = f"{st['seconds'] * 1000:10.1f}" if st['entries'] is not None else f"{'fallback':>10}"
+        print(f"{name[:40]:<40} {len(body) / 1024:8.0f} {fp['entries'] or 0:7d}  "
+              f"{fp['seconds'] * 1000:13.1f} {st_ms}  "
+              f"{fp['peak_bytes'] / 1024:10.0f} {st['peak_bytes'] / 1024:10.0f}  "
+              f"{'yes' if row['identical'] else 'NO'}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'benchmark': 'feed_parsers', 'results': results}, f, indent=2)
+    return 0 if all(row['identical'] for row in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+bench_ingest.py — Offline ingestion benchmark.
+
+Replays the recorded feed corpus (scripts/feed-fixtures/, one body per
+RSS_FEEDS entry, or the committed scripts/feed-corpus/ until those are
+recorded — see scripts/feed_fixtures.py) plus synthetic 1k- and
+10k-entry feeds through the same steps a fetch runs after the network:
+parse_feed_body() -> parse_feed_entries() -> enrich_articles(). No network,
+no database (USE_DATABASE is forced off).
+
+Reports entries/sec, p50/p99 per-feed latency and peak RSS, and writes the
+results as JSON so runs can be compared. --batch also enriches every parsed
+entry at once through api/lib/batch_enrich.py and checks the result is
+identical to enrich_articles() (exits non-zero if not).
+
+USAGE
+    python3 scripts/bench_ingest.py
+    python3 scripts/bench_ingest.py --rounds 5 --json bench.json
+    python3 scripts/bench_ingest.py --compare bench.json    # diff against an earlier run
+    python3 scripts/bench_ingest.py --synthetic 1000        # override the synthetic sizes
+    python3 scripts/bench_ingest.py --batch                 # batch enrichment timing + parity
+    python3 scripts/bench_ingest.py --allow-stand-ins       # partial recordings: stand-ins for the rest
+"""
+
+import os
+
+os.environ['USE_DATABASE'] = 'false'
+
+import argparse  # noqa: E402
+import copy  # noqa: E402
+import json  # noqa: E402
+import platform  # noqa: E402
+import resource  # noqa: E402
+import subprocess  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+from datetime import datetime, timezone  # noqa: E402
+
+from feed_fixtures import REPO_ROOT, load_corpus, synthetic_feed  # noqa: E402
+
+from api.lib.feed_fetcher import FEED_PARSER, parse_feed_body  # noqa: E402
+from api.shared import parse_feed_entries, enrich_articles  # noqa: E402
+from api.lib.batch_enrich import enrich_batch, np  # noqa: E402
+
+SYNTHETIC_SIZES = [1000, 10000]
+SYNTHETIC_CONFIG = {'category': 'Benchmark', 'priority': 2}
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(int(round(pct / 100 * len(ordered))) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_feed(name, config, body):
+    """One feed through parse -> entries -> enrich. Returns (seconds, entries, articles)."""
+    start = time.perf_counter()
+    feed = parse_feed_body(body)
+    entries = parse_feed_entries(feed, name, config)
+    relevant = enrich_articles(entries)
+    return time.perf_counter() - start, len(entries), len(relevant)
+
+
+def summarize(latencies, entries, seconds):
+    return {
+        'feeds': len(latencies),
+        'entries': entries,
+        'seconds': round(seconds, 4),
+        'entries_per_sec': round(entries / seconds, 1) if seconds else None,
+        'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+    }
+
+
+def run_benchmark(corpus, synthetic, rounds):
+    """Replay corpus feeds and synthetic feeds `rounds` times; return the results dict."""
+    corpus_latencies, corpus_entries, corpus_seconds = [], 0, 0.0
+    per_feed = {}
+    for _ in range(rounds):
+        for name, config, body, _recorded in corpus:
+            seconds, entries, relevant = run_feed(name, config, body)
+            corpus_latencies.append(seconds)
+            corpus_entries += entries
+            corpus_seconds += seconds
+            per_feed.setdefault(name, []).append(seconds)
+
+    synthetic_results = {}
+    for size, body in synthetic:
+        latencies, entries = [], 0
+        for _ in range(rounds):
+            seconds, entries, relevant = run_feed(f'synthetic-{size}', SYNTHETIC_CONFIG, body)
+            latencies.append(seconds)
+        synthetic_results[str(size)] = summarize(latencies, entries * rounds, sum(latencies))
+        synthetic_results[str(size)]['relevant'] = relevant
+
+    return {
+        'benchmark': 'ingest',
+        'run_at': datetime.now(timezone.utc).isoformat(),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'feed_parser': FEED_PARSER,
+        'rounds': rounds,
+        'corpus': {
+            **summarize(corpus_latencies, corpus_entries, corpus_seconds),
+            'feeds': len(corpus),
+            'recorded_feeds': sum(1 for c in corpus if c[3]),
+            'slowest': sorted(
+                ({'feed': n, 'p50_ms': round(percentile(l, 50) * 1000, 2)} for n, l in per_feed.items()),
+                key=lambda f: f['p50_ms'], reverse=True,
+            )[:5],
+        },
+        'synthetic': synthetic_results,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+    }
+
+
+def run_batch_check(corpus, synthetic):
+    """Enrich every parsed entry per-article and as one batch; compare time and output."""
+    entries = []
+    for name, config, body, _recorded in corpus:
+        entries += parse_feed_entries(parse_feed_body(body), name, config)
+    for size, body in synthetic:
+        entries += parse_feed_entries(parse_feed_body(body), f'synthetic-{size}', SYNTHETIC_CONFIG)
+
+    per_article_input, batch_input = copy.deepcopy(entries), copy.deepcopy(entries)
+    start = time.perf_counter()
+    expected = enrich_articles(per_article_input)
+    per_article_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    actual = enrich_batch(batch_input)
+    batch_seconds = time.perf_counter() - start
+
+    return {
+        'entries': len(entries),
+        'numpy': np is not None,
+        'per_article_seconds': round(per_article_seconds, 4),
+        'batch_seconds': round(batch_seconds, 4),
+        'identical': actual == expected,
+    }
+
+
+def print_results(results, baseline=None):
+    def delta(section, key, current):
+        if not baseline:
+            return ''
+        before = section(baseline).get(key) if section(baseline) else None
+        if not before or current is None:
+            return ''
+        return f" ({(current - before) / before * 100:+.0f}%)"
+
+    corpus = results['corpus']
+    print(f"corpus: {corpus['feeds']} feeds ({corpus['recorded_feeds']} recorded), "
+          f"{corpus['entries']} entries x{results['rounds']} rounds, parser={results['feed_parser']}")
+    rows = [('corpus', corpus, lambda r: r['corpus'])]
+    rows += [(f'synthetic-{size}', stats, lambda r, s=size: r['synthetic'].get(s))
+             for size, stats in results['synthetic'].items()]
+    print(f"{'set':<18} {'entries/s':>12} {'p50 ms':>16} {'p99 ms':>16}")
+    for label, stats, section in rows:
+        print(f"{label:<18} "
+              f"{stats['entries_per_sec']:>12,.0f}{delta(section, 'entries_per_sec', stats['entries_per_sec'])} "
+              f"{stats['p50_ms']:>9.2f}{delta(section, 'p50_ms', stats['p50_ms'])} "
+              f"{stats['p99_ms']:>9.2f}{delta(section, 'p99_ms', stats['p99_ms'])}")
+    print(f"peak RSS: {results['peak_rss_mb']} MB"
+          f"{delta(lambda r: r, 'peak_rss_mb', results['peak_rss_mb'])}")
+    batch = results.get('batch')
+    if batch:
+        backend = 'numpy/scipy' if batch['numpy'] else 'per-article fallback'
+        print(f"batch enrich ({backend}): {batch['entries']} entries, "
+              f"per-article {batch['per_article_seconds'] * 1000:.0f} ms, "
+              f"batch {batch['batch_seconds'] * 1000:.0f} ms, "
+              f"{'identical' if batch['identical'] else 'OUTPUT DIFFERS'}")
+    if baseline:
+        print(f"compared with {baseline.get('commit') or 'baseline'} run at {baseline.get('run_at')}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark feed parsing + enrichment offline.")
+    parser.add_argument('--rounds', type=int, default=3, help="Times to replay each feed (default 3)")
+    parser.add_argument('--synthetic', type=int, action='append', metavar='N',
+                        help=f"Synthetic feed size (repeatable, default {SYNTHETIC_SIZES})")
+    parser.add_argument('--feed', action='append', dest='feeds', metavar='NAME',
+                        help="Only replay this corpus feed (repeatable)")
+    parser.add_argument('--batch', action='store_true',
+                        help="Also time batch enrichment and check it matches enrich_articles()")
+    parser.add_argument('--allow-stand-ins', action='store_true',
+                        help="Use synthetic stand-ins for feeds with no recording (see feed_fixtures.py)")
+    parser.add_argument('--json', metavar='FILE', help="Write results as JSON")
+    parser.add_argument('--compare', metavar='FILE', help="Show % change against an earlier --json run")
+    args = parser.parse_args()
+
+    try:
+        corpus = load_corpus(args.feeds, args.allow_stand_ins)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+    synthetic = [(n, synthetic_feed(n)) for n in (args.synthetic or SYNTHETIC_SIZES)]
+
+    results = run_benchmark(corpus, synthetic, args.rounds)
+    if args.batch:
+        results['batch'] = run_batch_check(corpus, synthetic)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    print_results(results, baseline)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.batch and not results['batch']['identical']:
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
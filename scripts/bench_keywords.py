@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+bench_keywords.py — Cost of hot-reloading admin keyword lists, and matching
+throughput once they're loaded.
+
+Simulates a curator edit by swapping in keyword lists of growing size through
+apply_keyword_settings() (the same path refresh_keyword_lists() takes after
+reading admin_settings), then measures:
+
+  reload ms      apply the new lists + compile the enrichment matcher
+  match/s        matcher.find() over the corpus with the compiled matcher
+  enrich/s       enrich_articles() over the corpus (steady state, cached matcher)
+
+Runs offline on the recorded feed corpus from scripts/feed_fixtures.py
+(--allow-stand-ins to fill in feeds missing from a partial recording).
+
+USAGE
+    python3 scripts/bench_keywords.py
+    python3 scripts/bench_keywords.py --sizes 1000 10000 50000 --json keywords.json
+"""
+
+import os
+
+os.environ['USE_DATABASE'] = 'false'
+
+import argparse  # noqa: E402
+import copy  # noqa: E402
+import json  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+
+from feed_fixtures import load_corpus  # noqa: E402
+
+from api.lib.feed_fetcher import parse_feed_body  # noqa: E402
+from api.shared import (  # noqa: E402
+    DEFAULT_KEYWORDS, ICP_PAIN_SIGNALS, apply_keyword_settings, enrichment_matcher,
+    article_keyword_hits, enrich_articles, parse_feed_entries,
+)
+
+DEFAULT_SIZES = [1000, 5000, 10000]
+
+
+def synthetic_settings(size):
+    """Default lists padded to ~`size` keywords in total, a quarter of them phrases."""
+    settings = {key: list(words) for key, words in DEFAULT_KEYWORDS.items()}
+    keys = list(settings)
+    for i in range(max(size - sum(len(w) for w in settings.values()), 0)):
+        keyword = f'kw{i} phrase' if i % 4 == 0 else f'kw{i}'
+        settings[keys[i % len(keys)]].append(keyword)
+    return settings
+
+
+def corpus_entries(allow_stand_ins=False):
+    entries = []
+    for name, config, body, _recorded in load_corpus(allow_stand_ins=allow_stand_ins):
+        entries += parse_feed_entries(parse_feed_body(body), name, config)
+    return entries
+
+
+def measure(settings, entries, rounds):
+    start = time.perf_counter()
+    apply_keyword_settings(settings)
+    matcher = enrichment_matcher(ICP_PAIN_SIGNALS)
+    reload_seconds = time.perf_counter() - start
+
+    best_match = best_enrich = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for entry in entries:
+            article_keyword_hits(entry, matcher)
+        best_match = min(best_match, time.perf_counter() - start)
+
+        batch = copy.deepcopy(entries)
+        start = time.perf_counter()
+        enrich_articles(batch)
+        best_enrich = min(best_enrich, time.perf_counter() - start)
+
+    return {
+        'keywords': len(matcher.keywords),
+        'reload_ms': round(reload_seconds * 1000, 2),
+        'match_per_sec': round(len(entries) / best_match, 1),
+        'enrich_per_sec': round(len(entries) / best_enrich, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark keyword-list reload and matching.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help=f"Total keyword-list sizes to test (default {DEFAULT_SIZES})")
+    parser.add_argument('--rounds', type=int, default=3, help="Timed runs per size (best is kept)")
+    parser.add_argument('--allow-stand-ins', action='store_true',
+                        help="Use synthetic stand-ins for feeds with no recording (see feed_fixtures.py)")
+    parser.add_argument('--json', metavar='FILE', help="Write results as JSON")
+    args = parser.parse_args()
+
+    try:
+        entries = corpus_entries(args.allow_stand_ins)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+    results = [dict(measure(DEFAULT_KEYWORDS, entries, args.rounds), size='default')]
+    results += [dict(measure(synthetic_settings(n), entries, args.rounds), size=n) for n in args.sizes]
+    apply_keyword_settings({})
+
+    print(f"{len(entries)} corpus entries")
+    print(f"{'lists':>8} {'keywords':>9} {'reload ms':>10} {'match/s':>10} {'enrich/s':>10}")
+    for r in results:
+        print(f"{r['size']:>8} {r['keywords']:>9} {r['reload_ms']:>10.2f} "
+              f"{r['match_per_sec']:>10,.0f} {r['enrich_per_sec']:>10,.0f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'benchmark': 'keywords', 'entries': len(entries), 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
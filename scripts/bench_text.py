@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+bench_text.py — Throughput of summary normalization and bullet extraction.
+
+Takes the raw summary/description HTML of every entry in the feed corpus
+(scripts/feed_fixtures.py) plus synthetic full-text feeds, and times
+api/lib/text.py turning it into the digest summary and key bullets — the
+text work parse_feed_entries() and extract_key_bullets() do per entry.
+
+USAGE
+    python3 scripts/bench_text.py
+    python3 scripts/bench_text.py --rounds 10 --json text.json
+    python3 scripts/bench_text.py --allow-stand-ins    # partial recordings: stand-ins for the rest
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from feed_fixtures import load_corpus, synthetic_feed
+
+from api.lib.feed_fetcher import parse_feed_body  # noqa: E402
+from api.lib.text import summary_text, key_bullets  # noqa: E402
+
+
+def raw_summaries(bodies):
+    summaries = []
+    for body in bodies:
+        for entry in parse_feed_body(body).entries:
+            summaries.append(entry.get('summary') or entry.get('description') or '')
+    return summaries
+
+
+def measure(summaries, rounds):
+    best = float('inf')
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for markup in summaries:
+            key_bullets(summary_text(markup))
+        best = min(best, time.perf_counter() - start)
+    size = sum(len(s) for s in summaries)
+    return {
+        'entries': len(summaries),
+        'input_mb': round(size / 1e6, 2),
+        'seconds': round(best, 4),
+        'entries_per_sec': round(len(summaries) / best, 1),
+        'mb_per_sec': round(size / 1e6 / best, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark summary/bullet text normalization.")
+    parser.add_argument('--rounds', type=int, default=5, help="Timed runs per set (best is kept)")
+    parser.add_argument('--allow-stand-ins', action='store_true',
+                        help="Use synthetic stand-ins for feeds with no recording (see feed_fixtures.py)")
+    parser.add_argument('--json', metavar='FILE', help="Write results as JSON")
+    args = parser.parse_args()
+
+    try:
+        corpus = load_corpus(allow_stand_ins=args.allow_stand_ins)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+    sets = {
+        'corpus': raw_summaries(body for _, _, body, _ in corpus),
+        'synthetic-1000': raw_summaries([synthetic_feed(1000)]),
+        # Full-text bodies in the summary field, as some blog feeds send
+        'full-text-200': [('<p>' + 'Long paragraph of article text &amp; markup. ' * 40 + '</p>') * 20] * 200,
+    }
+    results = {name: measure(summaries, args.rounds) for name, summaries in sets.items()}
+
+    print(f"{'set':<16} {'entries':>8} {'input MB':>9} {'entries/s':>12} {'MB/s':>8}")
+    for name, r in results.items():
+        print(f"{name:<16} {r['entries']:>8} {r['input_mb']:>9.2f} {r['entries_per_sec']:>12,.0f} {r['mb_per_sec']:>8.1f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'benchmark': 'text', 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
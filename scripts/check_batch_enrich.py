@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+check_batch_enrich.py — Parity of batch and per-article enrichment.
+
+Enriches slices of the recorded feed corpus (scripts/feed_fixtures.py) with
+enrich_articles() and with api/lib/batch_enrich.py's matrix path, and exits
+non-zero if any output differs. Unlike bench_ingest.py --batch, it runs the
+state that only exists in database mode:
+
+  - ICP profiles loaded: the default profile drives `impact` and every
+    profile fills `icp_impacts`. They are built from the profile JSON in
+    archive/icp-context/ through the same signal index admin/icps.py saves.
+  - admin keyword lists applied: the ai/smb/viral_keywords rows seeded by
+    db/schema.sql, swapped in with apply_keyword_settings().
+  - batches smaller than MIN_BATCH, where enrich_batch() normally hands
+    off to enrich_articles(): both the hand-off and the matrix path forced
+    on are checked.
+
+USAGE
+    python3 scripts/check_batch_enrich.py
+"""
+
+import os
+
+os.environ['USE_DATABASE'] = 'false'
+
+import copy  # noqa: E402
+import json  # noqa: E402
+import re  # noqa: E402
+import sys  # noqa: E402
+
+from feed_fixtures import REPO_ROOT, load_corpus  # noqa: E402
+
+from api.lib.batch_enrich import MIN_BATCH, enrich_batch, np  # noqa: E402
+from api.lib.feed_fetcher import parse_feed_body  # noqa: E402
+from api.lib.icp_signals import profile_signals  # noqa: E402
+from api.shared import (  # noqa: E402
+    DEFAULT_KEYWORDS, IMPACT_TEMPLATES, apply_keyword_settings, enrich_articles,
+    keyword_lists, parse_feed_entries,
+)
+
+ICP_DIR = REPO_ROOT / 'archive' / 'icp-context'
+SCHEMA = REPO_ROOT / 'db' / 'schema.sql'
+# The profile whose signals drive `impact`, as is_default does in the database
+DEFAULT_PROFILE = 'Coaches_Consultants'
+
+
+def icp_profiles():
+    """[(name, signals)] for every archived ICP profile, as _load_icp_state() builds them."""
+    profiles = []
+    for path in sorted(ICP_DIR.glob('*.json')):
+        data = json.loads(path.read_text())
+        profiles.append((path.stem, profile_signals({'data': data})))
+    return profiles
+
+
+def admin_keyword_settings():
+    """The keyword-list rows db/schema.sql seeds into admin_settings."""
+    settings = {}
+    for key, value in re.findall(r"\('(\w+_keywords)', '(\[.*?\])'\)", SCHEMA.read_text()):
+        settings[key] = json.loads(value)
+    return settings
+
+
+def corpus_entries():
+    entries = []
+    for name, config, body, _recorded in load_corpus():
+        entries += parse_feed_entries(parse_feed_body(body), name, config)
+    return entries
+
+
+def compare(entries, pain_signals, profiles, min_batch):
+    expected = enrich_articles(copy.deepcopy(entries), pain_signals, profiles)
+    actual = enrich_batch(copy.deepcopy(entries), pain_signals, profiles, min_batch=min_batch)
+    return expected, actual == expected
+
+
+def main():
+    if np is None:
+        print("numpy/scipy not installed: enrich_batch() always uses enrich_articles()")
+        return 1
+
+    profiles = icp_profiles()
+    default = next(signals for name, signals in profiles if DEFAULT_PROFILE in name)
+    entries = corpus_entries()
+    sizes = sorted({min(n, len(entries)) for n in (1, 10, MIN_BATCH - 1)})
+    templates = {t['smb'] for t in IMPACT_TEMPLATES.values()}
+    print(f"{len(entries)} corpus entries, {len(profiles)} ICP profiles "
+          f"({sum(len(s) for _, s in profiles)} signals), MIN_BATCH={MIN_BATCH}")
+
+    failures = 0
+    for lists, settings in [('default lists', DEFAULT_KEYWORDS), ('admin lists', admin_keyword_settings())]:
+        apply_keyword_settings(settings)
+        counts = ', '.join(f"{key} {len(words)}" for key, words in keyword_lists().lists.items())
+        print(f"\n{lists} ({counts})")
+        for size in sizes:
+            subset = entries[:size]
+            for path, min_batch in [('hand-off', MIN_BATCH), ('matrix', 1)]:
+                expected, identical = compare(subset, default, profiles, min_batch)
+                # (article, profile) pairs a profile's own signal matched
+                matched = sum(1 for a in expected for impact in a['icp_impacts'].values()
+                              if impact not in templates)
+                print(f"  {len(subset):>4} articles  {path:<8}  {len(expected):>3} relevant, "
+                      f"{matched:>3} profile matches  {'identical' if identical else 'DIFFERENT'}")
+                failures += not identical
+    apply_keyword_settings({})
+
+    print(f"\n{'all identical' if not failures else f'{failures} mismatches'}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+check_dedupe.py — Sanity checks for story clustering (api/lib/dedupe.py).
+
+Runs small hand-built article sets through cluster_articles() and exits
+non-zero if any check fails:
+
+  - the same story from two outlets is folded into one with a coverage entry
+  - recurring issues from one source (shared boilerplate summary) both survive
+  - one source republishing the same title under a new link is folded
+
+USAGE
+    python3 scripts/check_dedupe.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.lib.dedupe import cluster_articles  # noqa: E402
+
+NEWSLETTER_SUMMARY = (
+    'Our weekly roundup of the most important news in AI, machine learning and '
+    'robotics. Subscribe to get the newsletter in your inbox every week. Read more on Medium.'
+)
+STORY_SUMMARY = (
+    'OpenAI released a new agent platform that lets small businesses automate invoicing, '
+    'scheduling and customer support, with pricing that starts at $20 per month.'
+)
+
+
+def article(source, title, link, summary, published):
+    return {'source': source, 'title': title, 'link': link, 'summary': summary,
+            'published': published, 'priority': 2}
+
+
+def check_cross_source_duplicate():
+    stories = cluster_articles([
+        article('TechCrunch AI', 'OpenAI launches agent platform for small businesses',
+                'https://techcrunch.com/a', STORY_SUMMARY, '2026-10-10T10:00:00+00:00'),
+        article('The Verge AI', 'OpenAI launches an agent platform for small businesses',
+                'https://theverge.com/b', STORY_SUMMARY, '2026-10-10T11:00:00+00:00'),
+    ])
+    assert len(stories) == 1, f"expected 1 story, got {len(stories)}"
+    assert [c['source'] for c in stories[0]['coverage']] == ['The Verge AI'], stories[0]['coverage']
+
+
+def check_same_source_issues_survive():
+    stories = cluster_articles([
+        article('Last Week in AI', 'Last Week in AI #201', 'https://medium.com/lwiai/201',
+                NEWSLETTER_SUMMARY, '2026-10-03T10:00:00+00:00'),
+        article('Last Week in AI', 'Last Week in AI #202', 'https://medium.com/lwiai/202',
+                NEWSLETTER_SUMMARY, '2026-10-10T10:00:00+00:00'),
+    ])
+    titles = sorted(s['title'] for s in stories)
+    assert titles == ['Last Week in AI #201', 'Last Week in AI #202'], titles
+    assert all(not s['coverage'] for s in stories), [s['coverage'] for s in stories]
+
+
+def check_same_source_repost_folds():
+    stories = cluster_articles([
+        article('TechCrunch AI', 'OpenAI launches agent platform for small businesses',
+                'https://techcrunch.com/a', STORY_SUMMARY, '2026-10-10T10:00:00+00:00'),
+        article('TechCrunch AI', 'OpenAI Launches Agent Platform for Small Businesses',
+                'https://techcrunch.com/a-updated', STORY_SUMMARY, '2026-10-10T12:00:00+00:00'),
+    ])
+    assert len(stories) == 1, f"expected 1 story, got {len(stories)}"
+
+
+CHECKS = [check_cross_source_duplicate, check_same_source_issues_survive, check_same_source_repost_folds]
+
+
+def main():
+    failed = 0
+    for check in CHECKS:
+        try:
+            check()
+            print(f"ok    {check.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAIL  {check.__name__}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
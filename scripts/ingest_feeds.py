@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+ingest_feeds.py — Run the background feed ingestion job locally.
+
+Polls every active feed (feeds table with USE_DATABASE=true, else the
+hardcoded RSS_FEEDS), enriches new entries and upserts them into the
+`articles` table. Same job the /api/ingest cron handler runs on Vercel.
+
+USAGE
+    USE_DATABASE=true python3 scripts/ingest_feeds.py
+    python3 scripts/ingest_feeds.py --days 3 --feed "TechCrunch AI" --dry-run
+    python3 scripts/ingest_feeds.py --force      # ignore the adaptive poll schedule
+    python3 scripts/ingest_feeds.py --no-prewarm # skip pre-generating top-story TL;DRs
+
+Feeds are only polled when due (see api/lib/poll_schedule.py). TL;DRs for the
+top PREWARM_TOP_N new stories are generated into the summary cache, within
+PREWARM_TOKEN_BUDGET tokens (see api/lib/prewarm.py).
+
+Prints a JSON summary to stdout. Exits non-zero only if every feed failed.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.lib.ingest import run_ingestion, INGEST_DAYS  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest RSS feeds into the articles table.")
+    parser.add_argument('--days', type=int, default=INGEST_DAYS,
+                        help=f"Only keep entries newer than this many days (default {INGEST_DAYS})")
+    parser.add_argument('--feed', action='append', dest='feeds', metavar='NAME',
+                        help="Only ingest this feed (repeatable)")
+    parser.add_argument('--dry-run', action='store_true',
+                        help="Fetch and enrich but don't write to the database")
+    parser.add_argument('--force', action='store_true',
+                        help="Poll every feed, ignoring the adaptive schedule")
+    parser.add_argument('--no-prewarm', action='store_true',
+                        help="Don't pre-generate TL;DRs for the top new stories")
+    args = parser.parse_args()
+
+    summary = run_ingestion(days=args.days, names=args.feeds, dry_run=args.dry_run, force=args.force,
+                            prewarm=not args.no_prewarm)
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+    if summary['feeds_checked'] and len(summary['errors']) == summary['feeds_checked']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+stub_batch_server.py — Local stand-in for the Message Batches API.
+
+Implements just enough of the Anthropic API for api/lib/summary_batches.py
+to run end to end without network access or cost:
+
+    POST /v1/messages/batches                 create a batch
+    GET  /v1/messages/batches/<id>            batch status (ends after --delay seconds)
+    GET  /v1/messages/batches/<id>/results    JSONL results
+    GET  /articles/<n>                        a sample article page to summarize
+
+Every request succeeds with a canned summary in the format its prompt asks
+for (HTML for TL;DR, JSON for executive), except that --error-every N
+makes every Nth request errored.
+
+USAGE
+    python3 scripts/stub_batch_server.py --port 8765 &
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8765 ANTHROPIC_API_KEY=stub \\
+        python3 scripts/summarize_batch.py --url http://127.0.0.1:8765/articles/1 \\
+        --url http://127.0.0.1:8765/articles/2 --type tldr --type executive --poll-interval 1
+"""
+
+import argparse
+import itertools
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BATCH_PATH = re.compile(r'^/v1/messages/batches/([\w-]+)(/results)?$')
+ARTICLE_PATH = re.compile(r'^/articles/(\d+)$')
+
+ARTICLE_HTML = """<html><head><title>Stub article {n}</title>
+<meta property="og:title" content="Stub article {n}"></head>
+<body><article><h1>Stub article {n}</h1>
+<p>Acme AI released a new model for small businesses on Tuesday. It automates
+invoicing and customer support, and the company says it cuts costs by 30 percent.</p>
+<p>Pricing starts at $20 per month. Early customers include several regional retailers.</p>
+</article></body></html>"""
+
+TLDR_TEXT = ("<h4>Quick Summary</h4><ul><li>Acme AI released a model for small businesses.</li>"
+             "<li>It automates invoicing and support.</li><li>Pricing starts at $20 per month.</li></ul>")
+EXECUTIVE_TEXT = json.dumps({
+    'title': 'Stub article',
+    'subtitle': 'Acme AI released a model for small businesses.',
+    'sections': [
+        {'heading': 'Overview', 'body': 'Acme AI released a new model on Tuesday.'},
+        {'heading': 'SMB Impact', 'body': 'Automates invoicing and customer support.'},
+    ],
+})
+
+
+class BatchStore:
+    def __init__(self, delay, error_every):
+        self.delay = delay
+        self.error_every = error_every
+        self.batches = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def create(self, requests):
+        with self._lock:
+            batch_id = f'msgbatch_stub_{next(self._ids):04d}'
+            self.batches[batch_id] = {'requests': requests, 'created': time.time()}
+        return batch_id
+
+    def ended(self, batch_id):
+        return time.time() - self.batches[batch_id]['created'] >= self.delay
+
+
+def _iso(ts):
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def make_handler(store):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, fmt, *args):
+            pass
+
+        def do_POST(self):
+            if self.path.split('?')[0] != '/v1/messages/batches':
+                return self.send_json({'type': 'error', 'error': {'type': 'not_found_error', 'message': self.path}}, 404)
+            length = int(self.headers.get('Content-Length', 0))
+            body = json.loads(self.rfile.read(length) or b'{}')
+            batch_id = store.create(body.get('requests', []))
+            self.send_json(self.batch_json(batch_id))
+
+        def do_GET(self):
+            path = self.path.split('?')[0]
+            match = ARTICLE_PATH.match(path)
+            if match:
+                return self.send_body(ARTICLE_HTML.format(n=match.group(1)).encode(), 'text/html')
+            match = BATCH_PATH.match(path)
+            if not match or match.group(1) not in store.batches:
+                return self.send_json({'type': 'error', 'error': {'type': 'not_found_error', 'message': path}}, 404)
+            batch_id = match.group(1)
+            if not match.group(2):
+                return self.send_json(self.batch_json(batch_id))
+            if not store.ended(batch_id):
+                return self.send_json({'type': 'error', 'error': {'type': 'invalid_request_error',
+                                       'message': 'Batch is still processing'}}, 400)
+            lines = [json.dumps(self.result_json(i, r))
+                     for i, r in enumerate(store.batches[batch_id]['requests'], 1)]
+            self.send_body(('\n'.join(lines) + '\n').encode(), 'application/binary')
+
+        def batch_json(self, batch_id):
+            batch = store.batches[batch_id]
+            ended = store.ended(batch_id)
+            total = len(batch['requests'])
+            errored = total // store.error_every if store.error_every and ended else 0
+            host = self.headers.get('Host', 'localhost')
+            return {
+                'id': batch_id,
+                'type': 'message_batch',
+                'processing_status': 'ended' if ended else 'in_progress',
+                'request_counts': {
+                    'processing': 0 if ended else total,
+                    'succeeded': total - errored if ended else 0,
+                    'errored': errored, 'canceled': 0, 'expired': 0,
+                },
+                'created_at': _iso(batch['created']),
+                'expires_at': _iso(batch['created'] + timedelta(days=1).total_seconds()),
+                'ended_at': _iso(batch['created'] + store.delay) if ended else None,
+                'archived_at': None,
+                'cancel_initiated_at': None,
+                'results_url': f'http://{host}/v1/messages/batches/{batch_id}/results' if ended else None,
+            }
+
+        def result_json(self, index, request):
+            if store.error_every and index % store.error_every == 0:
+                return {'custom_id': request['custom_id'], 'result': {
+                    'type': 'errored',
+                    'error': {'type': 'error', 'error': {'type': 'api_error', 'message': 'stub error'}},
+                }}
+            params = request['params']
+            prompt = params['messages'][0]['content']
+            text = EXECUTIVE_TEXT if 'Output a valid JSON' in prompt else TLDR_TEXT
+            return {'custom_id': request['custom_id'], 'result': {'type': 'succeeded', 'message': {
+                'id': f"msg_stub_{request['custom_id'][:16]}",
+                'type': 'message',
+                'role': 'assistant',
+                'model': params['model'],
+                'content': [{'type': 'text', 'text': text}],
+                'stop_reason': 'end_turn',
+                'stop_sequence': None,
+                'usage': {'input_tokens': len(prompt) // 4, 'output_tokens': len(text) // 4},
+            }}}
+
+        def send_json(self, data, status=200):
+            self.send_body(json.dumps(data).encode(), 'application/json', status)
+
+        def send_body(self, body, content_type, status=200):
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub Message Batches API server.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--delay', type=float, default=2.0,
+                        help="Seconds before a new batch reports ended (default 2)")
+    parser.add_argument('--error-every', type=int, default=0, metavar='N',
+                        help="Make every Nth request in a batch errored")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(BatchStore(args.delay, args.error_every)))
+    print(f"Stub batch API on http://{args.host}:{args.port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
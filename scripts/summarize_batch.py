@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+summarize_batch.py — Backfill the summary cache through the Message Batches API.
+
+Collects the last --days of articles (the `articles` table with
+USE_DATABASE=true, else a live fetch of RSS_FEEDS), skips summaries already
+cached, submits the rest as one asynchronous batch at batch pricing, waits
+for it and writes the results into the summary cache (SUMMARY_CACHE).
+
+USAGE
+    USE_DATABASE=true SUMMARY_CACHE=supabase python3 scripts/summarize_batch.py --days 1
+    python3 scripts/summarize_batch.py --days 1 --type tldr --type executive --limit 50
+    python3 scripts/summarize_batch.py --url https://example.com/post --dry-run
+    python3 scripts/summarize_batch.py --collect batch-manifest.json   # resume a submitted batch
+
+--manifest FILE records the batch ids and what each request was for as soon
+as the batch is submitted, so an interrupted run can be finished with
+--collect FILE instead of paying for a second batch.
+
+Test offline against scripts/stub_batch_server.py by pointing
+ANTHROPIC_BASE_URL at it.
+
+Prints a JSON summary to stdout.
+"""
+
+import argparse
+import json
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from api.lib.summary_batches import (  # noqa: E402
+    POLL_INTERVAL_SECONDS, POLL_TIMEOUT_SECONDS, collect_batch, get_client,
+    pending_summaries, run_batch_summaries, wait_for_batch,
+)
+from api.lib.prewarm import select_top_stories  # noqa: E402
+
+USE_DATABASE = os.environ.get('USE_DATABASE', 'false').lower() == 'true'
+
+
+def load_articles(days):
+    """Articles from the last `days`: the articles table, else a live fetch."""
+    if USE_DATABASE:
+        from api.lib.supabase import get_articles_since
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+        return [row['data'] for row in get_articles_since(cutoff)]
+    from api.shared import RSS_FEEDS
+    from api.lib.feed_fetcher import fetch_feeds
+    return fetch_feeds(list(RSS_FEEDS), days)['articles']
+
+
+def write_manifest(path, batch_ids, manifest):
+    with open(path, 'w') as f:
+        json.dump({'batch_ids': batch_ids, 'requests': manifest}, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-generate article summaries into the summary cache.")
+    parser.add_argument('--days', type=int, default=1, help="Articles from the last N days (default 1)")
+    parser.add_argument('--url', action='append', dest='urls', metavar='URL',
+                        help="Summarize this article URL instead (repeatable)")
+    parser.add_argument('--type', action='append', dest='types', choices=['tldr', 'executive'],
+                        help="Summary type (repeatable, default tldr)")
+    parser.add_argument('--limit', type=int, help="Only the top N stories (priority, then viral score)")
+    parser.add_argument('--poll-interval', type=float, default=POLL_INTERVAL_SECONDS,
+                        help=f"Seconds between status checks (default {POLL_INTERVAL_SECONDS})")
+    parser.add_argument('--timeout', type=float, default=POLL_TIMEOUT_SECONDS,
+                        help="Give up waiting after this many seconds")
+    parser.add_argument('--manifest', metavar='FILE', help="Write the batch manifest here on submit")
+    parser.add_argument('--collect', metavar='FILE',
+                        help="Don't submit; wait for and collect the batches in this manifest")
+    parser.add_argument('--dry-run', action='store_true', help="Only count what would be submitted")
+    args = parser.parse_args()
+
+    if args.collect:
+        with open(args.collect) as f:
+            saved = json.load(f)
+        client = get_client()
+        results = {}
+        for batch_id in saved['batch_ids']:
+            wait_for_batch(client, batch_id, args.poll_interval, args.timeout)
+            results[batch_id] = collect_batch(client, batch_id, saved['requests'])
+        json.dump({'collected': results}, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return
+
+    if args.urls:
+        articles = [{'link': url, 'title': 'Article'} for url in args.urls]
+    else:
+        articles = load_articles(args.days)
+    if args.limit:
+        articles = select_top_stories(articles, args.limit)
+    types = tuple(dict.fromkeys(args.types or ['tldr']))
+
+    if args.dry_run:
+        pending = pending_summaries(articles, types)
+        json.dump({'articles': len(articles), 'pending': len(pending)}, sys.stdout, indent=2)
+        sys.stdout.write('\n')
+        return
+
+    on_submit = (lambda ids, manifest: write_manifest(args.manifest, ids, manifest)) if args.manifest else None
+    summary = run_batch_summaries(articles, types, poll_interval=args.poll_interval,
+                                  timeout=args.timeout, on_submit=on_submit)
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write('\n')
+
+
+if __name__ == '__main__':
+    main()